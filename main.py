@@ -234,16 +234,28 @@ def save_progress_checkpoint(
         logger.warning(f"Failed to save checkpoint: {e}")
 
 
+def find_checkpoints(output_dir: str, prefix: str = "checkpoint_") -> list[tuple[float, Path]]:
+    """List checkpoint files with their modification times in a single directory scan."""
+    try:
+        with os.scandir(output_dir) as entries:
+            return [
+                (entry.stat().st_mtime, Path(entry.path))
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(".json") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
 def load_latest_checkpoint(output_dir: str, step: str, logger: logging.Logger) -> list[dict[str, Any]]:
     """Load the latest checkpoint for a given step."""
-    checkpoint_pattern = f"checkpoint_{step}_*.json"
-    checkpoint_files = list(Path(output_dir).glob(checkpoint_pattern))
+    checkpoint_files = find_checkpoints(output_dir, f"checkpoint_{step}_")
     
     if not checkpoint_files:
         return []
     
     # Get the most recent checkpoint
-    latest_checkpoint = max(checkpoint_files, key=lambda p: p.stat().st_mtime)
+    _, latest_checkpoint = max(checkpoint_files)
     
     try:
         with open(latest_checkpoint) as f:
@@ -301,16 +313,16 @@ def apply_ai_developer_overrides(
 
 def cleanup_old_checkpoints(output_dir: str, keep_latest: int = 3, logger: logging.Logger = None) -> None:
     """Clean up old checkpoint files, keeping only the most recent ones."""
-    checkpoint_files = list(Path(output_dir).glob("checkpoint_*.json"))
+    checkpoint_files = find_checkpoints(output_dir)
     
     if len(checkpoint_files) <= keep_latest:
         return
     
     # Sort by modification time, newest first
-    checkpoint_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    checkpoint_files.sort(reverse=True)
     
     # Remove old checkpoints
-    for old_checkpoint in checkpoint_files[keep_latest:]:
+    for _, old_checkpoint in checkpoint_files[keep_latest:]:
         try:
             old_checkpoint.unlink()
             if logger:
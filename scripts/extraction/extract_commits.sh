@@ -9,35 +9,12 @@ source "${SCRIPT_DIR}/utils.sh"
 OUTPUT_FILE="${OUTPUT_FILE:-org_commits.csv}"
 REPOS_FILE="${REPOS_FILE:-repos.json}"
 DAYS_BACK="${DAYS_BACK:-7}"
+MAX_PARALLEL_REPOS="${MAX_PARALLEL_REPOS:-4}"
 MAX_RETRIES=3
 
 # CSV header
 CSV_HEADER="Repository,SHA,Author_Login,Author_Email,Author_Name,Committer_Login,Committer_Email,Date,Message,URL,PR_Number,Files_Changed,Additions,Deletions,Is_Merge_Commit,Co_Authors"
 
-# Function to extract PR number from commit message
-extract_pr_number() {
-    local message="$1"
-    
-    # Look for patterns like (#123), #123, or Merge pull request #123
-    if echo "$message" | grep -qE '#[0-9]+'; then
-        echo "$message" | grep -oE '#[0-9]+' | grep -oE '[0-9]+' | head -1
-    else
-        echo ""
-    fi
-}
-
-# Function to extract co-authors from commit message
-extract_co_authors() {
-    local message="$1"
-    
-    # Look for Co-authored-by: patterns
-    local co_authors=$(echo "$message" | grep -oE 'Co-authored-by: [^<]+<[^>]+>' | \
-                       sed 's/Co-authored-by: //' | tr '\n' ';')
-    
-    # Remove trailing semicolon
-    echo "${co_authors%;}""
-}
-
 # Function to check if AI tool was used (simple pattern matching)
 detect_ai_assistance() {
     local message="$1"
@@ -51,114 +28,118 @@ detect_ai_assistance() {
     fi
 }
 
+# GraphQL query for default-branch history with per-commit stats.
+# gh --paginate follows pageInfo/endCursor, so one query covers every page.
+COMMIT_HISTORY_QUERY='
+query($owner: String!, $repo: String!, $since: GitTimestamp!, $until: GitTimestamp!, $endCursor: String) {
+  repository(owner: $owner, name: $repo) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100, since: $since, until: $until, after: $endCursor) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              oid
+              url
+              message
+              additions
+              deletions
+              changedFilesIfAvailable
+              parents { totalCount }
+              authoredDate
+              author { name email user { login } }
+              committer { email user { login } }
+            }
+          }
+        }
+      }
+    }
+  }
+}'
+
+# Turn each history page into finished CSV rows (one per commit). Commas in free text
+# become semicolons, PR numbers come from "#123" references and co-authors from
+# Co-authored-by trailers, all within this one jq pass. Date uses authoredDate, which is
+# UTC; author.date is a GitTimestamp that keeps the author's local offset.
+COMMIT_ROWS_JQ='
+.data.repository.defaultBranchRef.target.history.nodes[]?
+| ((.message // "") | gsub("[\t\r\n]"; " ") | gsub(","; ";") | gsub("\""; "")) as $message
+| [
+    $repo,
+    .oid,
+    (.author.user.login // ""),
+    (.author.email // ""),
+    ((.author.name // "") | gsub(","; ";")),
+    (.committer.user.login // ""),
+    (.committer.email // ""),
+    (.authoredDate // ""),
+    (if ($message | length) > 200 then $message[:197] + "..." else $message end),
+    (.url // ""),
+    (first($message | match("#([0-9]+)").captures[0].string) // ""),
+    (.changedFilesIfAvailable // 0),
+    (.additions // 0),
+    (.deletions // 0),
+    (.parents.totalCount > 1),
+    ([$message | match("Co-authored-by: [^<]+<[^>]+>"; "g").string
+      | ltrimstr("Co-authored-by: ")] | join(";"))
+  ]
+| map(tostring) | join(",")'
+
 # Function to fetch commits for a single repository
 fetch_repo_commits() {
     local repo="$1"
     local start_date="$2"
     local end_date="$3"
+    local result_file="$4"
     local temp_file=$(mktemp)
-    local page=1
-    local per_page=100
+    local response_file=$(mktemp)
+    local error_file=$(mktemp)
+    local retry_count=0
     
     echo "Processing repository: $repo"
     
-    while true; do
-        show_progress $page 10 "Fetching commits page $page..."
-        
-        # Fetch commits using GitHub API
-        local commits=$(gh api \
-            -H "Accept: application/vnd.github+json" \
-            -H "X-GitHub-Api-Version: 2022-11-28" \
-            "/repos/${GITHUB_ORG}/${repo}/commits?since=${start_date}&until=${end_date}&per_page=${per_page}&page=${page}" 2>&1)
-        
+    # Fetch all history pages, including additions/deletions/files, in one paginated call
+    while ! gh api graphql --paginate \
+            -f query="$COMMIT_HISTORY_QUERY" \
+            -f owner="$GITHUB_ORG" \
+            -f repo="$repo" \
+            -f since="$start_date" \
+            -f until="$end_date" > "$response_file" 2> "$error_file"; do
         # Check for rate limit
-        if echo "$commits" | grep -q "rate limit"; then
-            handle_rate_limit 0 || continue
+        if grep -qi "rate limit" "$error_file"; then
+            if ! handle_rate_limit $retry_count; then
+                # Never build rows from a partial --paginate response
+                echo "Error fetching commits for $repo: rate limit retries exhausted" >&2
+                rm -f "$temp_file" "$response_file" "$error_file"
+                return 1
+            fi
+            ((retry_count++))
+            continue
         fi
         
         # Check for errors
-        if echo "$commits" | grep -q "Not Found"; then
+        if grep -q "Could not resolve to a Repository" "$error_file"; then
+            # A repository gone since listing is skipped; it must not hold back the run date
             echo "Warning: Repository $repo not found or no access" >&2
-            break
-        fi
-        
-        if echo "$commits" | grep -qE "error|Error"; then
-            echo "Error fetching commits for $repo: $commits" >&2
-            break
+            rm -f "$temp_file" "$response_file" "$error_file"
+            return 0
         fi
-        
-        # Check if we got any commits
-        local commit_count=$(echo "$commits" | jq 'length' 2>/dev/null || echo "0")
-        if [ "$commit_count" -eq 0 ]; then
-            break
-        fi
-        
-        # Process each commit
-        echo "$commits" | jq -c '.[]' | while read -r commit; do
-            local sha=$(echo "$commit" | jq -r '.sha // ""' | cut -c1-7)
-            local full_sha=$(echo "$commit" | jq -r '.sha // ""')
-            local author_login=$(echo "$commit" | jq -r '.author.login // ""')
-            local author_email=$(echo "$commit" | jq -r '.commit.author.email // ""')
-            local author_name=$(echo "$commit" | jq -r '.commit.author.name // ""' | sed 's/,/;/g')
-            local committer_login=$(echo "$commit" | jq -r '.committer.login // ""')
-            local committer_email=$(echo "$commit" | jq -r '.commit.committer.email // ""')
-            local date=$(echo "$commit" | jq -r '.commit.author.date // ""')
-            local message=$(echo "$commit" | jq -r '.commit.message // ""' | sed 's/,/;/g' | sed 's/"//g' | tr '\n' ' ')
-            local url=$(echo "$commit" | jq -r '.html_url // ""')
-            
-            # Check if it's a merge commit
-            local parent_count=$(echo "$commit" | jq '.parents | length')
-            local is_merge="false"
-            if [ "$parent_count" -gt 1 ]; then
-                is_merge="true"
-            fi
-            
-            # Extract PR number
-            local pr_number=$(extract_pr_number "$message")
-            
-            # Extract co-authors
-            local co_authors=$(extract_co_authors "$message")
-            
-            # Fetch commit details for file statistics
-            local commit_details=$(gh api \
-                -H "Accept: application/vnd.github+json" \
-                -H "X-GitHub-Api-Version: 2022-11-28" \
-                "/repos/${GITHUB_ORG}/${repo}/commits/${full_sha}" 2>/dev/null)
-            
-            local files_changed=0
-            local additions=0
-            local deletions=0
-            
-            if [ -n "$commit_details" ]; then
-                files_changed=$(echo "$commit_details" | jq '.files | length' 2>/dev/null || echo "0")
-                additions=$(echo "$commit_details" | jq '.stats.additions // 0' 2>/dev/null || echo "0")
-                deletions=$(echo "$commit_details" | jq '.stats.deletions // 0' 2>/dev/null || echo "0")
-            fi
-            
-            # Truncate message if too long
-            if [ ${#message} -gt 200 ]; then
-                message="${message:0:197}..."
-            fi
-            
-            # Write to temp file
-            echo "${repo},${full_sha},${author_login},${author_email},${author_name},${committer_login},${committer_email},${date},${message},${url},${pr_number},${files_changed},${additions},${deletions},${is_merge},${co_authors}" >> "$temp_file"
-        done
-        
-        # Check if there are more pages
-        if [ "$commit_count" -lt "$per_page" ]; then
-            break
-        fi
-        
-        ((page++))
+        echo "Error fetching commits for $repo: $(cat "$error_file")" >&2
+        rm -f "$temp_file" "$response_file" "$error_file"
+        return 1
     done
     
-    echo ""  # New line after progress
+    # Build every CSV row for this repository in a single jq pass
+    jq -r --arg repo "$repo" "$COMMIT_ROWS_JQ" "$response_file" > "$temp_file"
+    
+    rm -f "$response_file" "$error_file"
     
-    # Append to main output file
+    # Hand results back to main, which appends them in repository order
     if [ -s "$temp_file" ]; then
-        cat "$temp_file" >> "$OUTPUT_FILE"
+        mv "$temp_file" "$result_file"
+    else
+        rm -f "$temp_file"
     fi
-    rm -f "$temp_file"
 }
 
 # Main execution
@@ -209,13 +190,42 @@ main() {
     echo "Date range: $start_date to $end_date"
     echo ""
     
-    # Process each repository
+    # Process repositories in parallel; each job writes its own result file
+    local results_dir=$(mktemp -d)
+    local job_pids=()
+    local job_repos=()
     while IFS= read -r repo; do
         ((current_repo++))
+        wait_for_job_slot "$MAX_PARALLEL_REPOS"
         echo "[$current_repo/$total_repos] $repo"
-        fetch_repo_commits "$repo" "$start_date" "$end_date"
+        fetch_repo_commits "$repo" "$start_date" "$end_date" \
+            "${results_dir}/$(printf '%05d' "$current_repo").csv" &
+        job_pids+=("$!")
+        job_repos+=("$repo")
     done <<< "$repos"
     
+    # Wait on each job by PID; a bare wait would discard their exit statuses
+    local failed_repos=()
+    local i
+    for i in "${!job_pids[@]}"; do
+        if ! wait "${job_pids[$i]}"; then
+            failed_repos+=("${job_repos[$i]}")
+        fi
+    done
+    
+    # Append per-repository results in repository order
+    for result_file in "$results_dir"/*.csv; do
+        [ -f "$result_file" ] && cat "$result_file" >> "$OUTPUT_FILE"
+    done
+    rm -rf "$results_dir"
+    
+    # Keep last_run_date where it is so the next run retries the same window
+    if [ ${#failed_repos[@]} -gt 0 ]; then
+        echo "Error: commit extraction failed for ${#failed_repos[@]} repositories: ${failed_repos[*]}" >&2
+        echo "State not updated; rerun to retry the same date range." >&2
+        exit 1
+    fi
+    
     # Update state file
     update_state
     
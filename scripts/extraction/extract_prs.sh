@@ -9,159 +9,83 @@ source "${SCRIPT_DIR}/utils.sh"
 OUTPUT_FILE="${OUTPUT_FILE:-org_prs.csv}"
 REPOS_FILE="${REPOS_FILE:-repos.json}"
 DAYS_BACK="${DAYS_BACK:-7}"
-MAX_RETRIES=3
+MAX_PARALLEL_REPOS="${MAX_PARALLEL_REPOS:-4}"
+PR_LIMIT="${PR_LIMIT:-1000}"  # Max PRs fetched per repository
 
 # CSV header
 CSV_HEADER="Repository,PR_Number,PR_ID,Title,Author,State,Created_At,Merged_At,Closed_At,URL,Base_Branch,Head_Branch,Files_Changed,Additions,Deletions,Linear_Ticket_ID,Has_Linear_Ticket"
 
-# Function to extract Linear ticket ID from PR title or body
-extract_linear_ticket() {
-    local title="$1"
-    local body="$2"
-    
-    # Look for patterns like ENG-1234, PROJ-567, etc.
-    local ticket_pattern='[A-Z]+-[0-9]+'
-    
-    # Check title first
-    if echo "$title" | grep -qE "$ticket_pattern"; then
-        echo "$title" | grep -oE "$ticket_pattern" | head -1
-        return
-    fi
-    
-    # Check body if not found in title
-    if echo "$body" | grep -qE "$ticket_pattern"; then
-        echo "$body" | grep -oE "$ticket_pattern" | head -1
-        return
-    fi
-    
-    echo ""
-}
-
-# Function to fetch PR details including files changed
-fetch_pr_details() {
-    local repo="$1"
-    local pr_number="$2"
-    local retry_count=0
-    
-    while [ $retry_count -lt $MAX_RETRIES ]; do
-        # Fetch PR details
-        local pr_details=$(gh api \
-            -H "Accept: application/vnd.github+json" \
-            -H "X-GitHub-Api-Version: 2022-11-28" \
-            "/repos/${GITHUB_ORG}/${repo}/pulls/${pr_number}" 2>&1)
-        
-        # Check for rate limit
-        if echo "$pr_details" | grep -q "rate limit"; then
-            handle_rate_limit $retry_count || return 1
-            ((retry_count++))
-            continue
-        fi
-        
-        # Check for errors
-        if echo "$pr_details" | grep -q "error"; then
-            echo "Error fetching PR #${pr_number} details: $pr_details" >&2
-            return 1
-        fi
-        
-        # Extract fields
-        echo "$pr_details" | jq -r '{
-            changed_files: .changed_files,
-            additions: .additions,
-            deletions: .deletions,
-            body: .body
-        }'
-        return 0
-    done
-    
-    return 1
-}
+# Turn the PR list into finished CSV rows. The Linear ticket (e.g. ENG-1234) is taken
+# from the title first, then the body; the body itself never leaves jq.
+PR_ROWS_JQ='
+.[]
+| ((.title // "") | gsub(","; ";") | gsub("\""; "")) as $title
+| (first(($title, (.body // "")) | match("[A-Z]+-[0-9]+").string) // "") as $ticket
+| [
+    $repo,
+    .number,
+    .id,
+    $title,
+    (.author.login // ""),
+    (.state // ""),
+    (.createdAt // ""),
+    (.mergedAt // ""),
+    (.closedAt // ""),
+    (.url // ""),
+    (.baseRefName // ""),
+    (.headRefName // ""),
+    (.changedFiles // 0),
+    (.additions // 0),
+    (.deletions // 0),
+    $ticket,
+    ($ticket != "")
+  ]
+| map(tostring) | join(",")'
 
 # Function to fetch PRs for a single repository
 fetch_repo_prs() {
     local repo="$1"
     local start_date="$2"
     local end_date="$3"
+    local result_file="$4"
     local temp_file=$(mktemp)
+    local response_file=$(mktemp)
+    local error_file=$(mktemp)
+    local retry_count=0
     
     echo "Processing repository: $repo"
     
-    # Use gh pr list with pagination
-    local page=1
-    local has_more=true
-    
-    while [ "$has_more" == "true" ]; do
-        local prs=$(gh pr list \
+    # The created:>= search filters server-side and gh pages through results up to --limit.
+    # Only a failed call's stderr is inspected, never the PR titles and bodies themselves.
+    while ! gh pr list \
             --repo "${GITHUB_ORG}/${repo}" \
             --state all \
-            --limit 100 \
-            --json number,id,title,author,state,createdAt,mergedAt,closedAt,url,baseRefName,headRefName \
-            --search "created:>=${start_date}" 2>&1)
-        
-        # Check for errors
-        if echo "$prs" | grep -q "error"; then
-            echo "Error fetching PRs for $repo: $prs" >&2
-            rm -f "$temp_file"
-            return 1
-        fi
-        
-        # Process each PR
-        echo "$prs" | jq -c '.[]' | while read -r pr; do
-            local pr_number=$(echo "$pr" | jq -r '.number')
-            local pr_id=$(echo "$pr" | jq -r '.id')
-            local title=$(echo "$pr" | jq -r '.title // ""' | sed 's/,/;/g' | sed 's/"//g')
-            local author=$(echo "$pr" | jq -r '.author.login // ""')
-            local state=$(echo "$pr" | jq -r '.state // ""')
-            local created_at=$(echo "$pr" | jq -r '.createdAt // ""')
-            local merged_at=$(echo "$pr" | jq -r '.mergedAt // ""')
-            local closed_at=$(echo "$pr" | jq -r '.closedAt // ""')
-            local url=$(echo "$pr" | jq -r '.url // ""')
-            local base_branch=$(echo "$pr" | jq -r '.baseRefName // ""')
-            local head_branch=$(echo "$pr" | jq -r '.headRefName // ""')
-            
-            # Skip if created before start date
-            if [ -n "$created_at" ] && [ "$created_at" < "$start_date" ]; then
-                continue
-            fi
-            
-            # Fetch additional PR details (files changed, body)
-            show_progress $pr_number 100 "Fetching PR #$pr_number details..."
-            local details=$(fetch_pr_details "$repo" "$pr_number")
-            
-            if [ $? -eq 0 ]; then
-                local files_changed=$(echo "$details" | jq -r '.changed_files // 0')
-                local additions=$(echo "$details" | jq -r '.additions // 0')
-                local deletions=$(echo "$details" | jq -r '.deletions // 0')
-                local body=$(echo "$details" | jq -r '.body // ""')
-                
-                # Extract Linear ticket ID
-                local linear_ticket=$(extract_linear_ticket "$title" "$body")
-                local has_linear="false"
-                if [ -n "$linear_ticket" ]; then
-                    has_linear="true"
-                fi
-                
-                # Write to temp file
-                echo "${repo},${pr_number},${pr_id},${title},${author},${state},${created_at},${merged_at},${closed_at},${url},${base_branch},${head_branch},${files_changed},${additions},${deletions},${linear_ticket},${has_linear}" >> "$temp_file"
-            else
-                # Write with empty details if fetch failed
-                echo "${repo},${pr_number},${pr_id},${title},${author},${state},${created_at},${merged_at},${closed_at},${url},${base_branch},${head_branch},0,0,0,," >> "$temp_file"
+            --limit "$PR_LIMIT" \
+            --json number,id,title,author,state,createdAt,mergedAt,closedAt,url,baseRefName,headRefName,changedFiles,additions,deletions,body \
+            --search "created:>=${start_date}" > "$response_file" 2> "$error_file"; do
+        # Check for rate limit
+        if grep -qi "rate limit" "$error_file"; then
+            if ! handle_rate_limit $retry_count; then
+                echo "Error fetching PRs for $repo: rate limit retries exhausted" >&2
+                rm -f "$temp_file" "$response_file" "$error_file"
+                return 1
             fi
-        done
-        
-        # Check if there are more pages (simplified - gh pr list doesn't have built-in pagination info)
-        local pr_count=$(echo "$prs" | jq 'length')
-        if [ "$pr_count" -lt 100 ]; then
-            has_more=false
-        else
-            ((page++))
+            ((retry_count++))
+            continue
         fi
+        
+        echo "Error fetching PRs for $repo: $(cat "$error_file")" >&2
+        rm -f "$temp_file" "$response_file" "$error_file"
+        return 1
     done
     
-    # Append to main output file
-    cat "$temp_file" >> "$OUTPUT_FILE"
-    rm -f "$temp_file"
+    # Build every CSV row for this repository in a single jq pass
+    jq -r --arg repo "$repo" "$PR_ROWS_JQ" "$response_file" > "$temp_file"
+    
+    rm -f "$response_file" "$error_file"
     
-    echo ""  # New line after progress
+    # Hand results back to main, which appends them in repository order
+    mv "$temp_file" "$result_file"
 }
 
 # Main execution
@@ -208,13 +132,42 @@ main() {
     echo "Date range: $start_date to $end_date"
     echo ""
     
-    # Process each repository
+    # Process repositories in parallel; each job writes its own result file
+    local results_dir=$(mktemp -d)
+    local job_pids=()
+    local job_repos=()
     while IFS= read -r repo; do
         ((current_repo++))
+        wait_for_job_slot "$MAX_PARALLEL_REPOS"
         echo "[$current_repo/$total_repos] $repo"
-        fetch_repo_prs "$repo" "$start_date" "$end_date"
+        fetch_repo_prs "$repo" "$start_date" "$end_date" \
+            "${results_dir}/$(printf '%05d' "$current_repo").csv" &
+        job_pids+=("$!")
+        job_repos+=("$repo")
     done <<< "$repos"
     
+    # Wait on each job by PID; a bare wait would discard their exit statuses
+    local failed_repos=()
+    local i
+    for i in "${!job_pids[@]}"; do
+        if ! wait "${job_pids[$i]}"; then
+            failed_repos+=("${job_repos[$i]}")
+        fi
+    done
+    
+    # Append per-repository results in repository order
+    for result_file in "$results_dir"/*.csv; do
+        [ -f "$result_file" ] && cat "$result_file" >> "$OUTPUT_FILE"
+    done
+    rm -rf "$results_dir"
+    
+    # Keep last_run_date where it is so the next run retries the same window
+    if [ ${#failed_repos[@]} -gt 0 ]; then
+        echo "Error: PR extraction failed for ${#failed_repos[@]} repositories: ${failed_repos[*]}" >&2
+        echo "State not updated; rerun to retry the same date range." >&2
+        exit 1
+    fi
+    
     # Update state file
     update_state
     
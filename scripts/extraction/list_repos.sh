@@ -8,94 +8,103 @@ source "${SCRIPT_DIR}/utils.sh"
 # Configuration
 OUTPUT_FILE="${OUTPUT_FILE:-repos.json}"
 INCLUDE_ARCHIVED="${INCLUDE_ARCHIVED:-false}"
+# Opt-in TTL for gh's response cache, e.g. 1h. gh replays cached pages without checking
+# for changes, so new or recently pushed repositories can be missed until it expires.
+REPO_LIST_CACHE_TTL="${REPO_LIST_CACHE_TTL:-0}"
+
+# Repositories page query; a null $archived returns archived repositories too
+REPOS_QUERY='
+query($org: String!, $archived: Boolean, $endCursor: String) {
+  organization(login: $org) {
+    repositories(first: 100, isArchived: $archived, after: $endCursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        nameWithOwner
+        description
+        url
+        createdAt
+        updatedAt
+        pushedAt
+        diskUsage
+        primaryLanguage { name }
+        defaultBranchRef { name }
+        isArchived
+        isDisabled
+        isPrivate
+        hasIssuesEnabled
+        hasProjectsEnabled
+        hasWikiEnabled
+      }
+    }
+  }
+}'
+
+# Map each repository node to the repos.json record shape, one compact object per line
+REPO_RECORD_JQ='
+.data.organization.repositories.nodes[] | {
+  name: .name,
+  full_name: .nameWithOwner,
+  description: .description,
+  html_url: .url,
+  clone_url: (.url + ".git"),
+  created_at: .createdAt,
+  updated_at: .updatedAt,
+  pushed_at: .pushedAt,
+  size: .diskUsage,
+  language: .primaryLanguage.name,
+  default_branch: .defaultBranchRef.name,
+  archived: .isArchived,
+  disabled: .isDisabled,
+  private: .isPrivate,
+  has_issues: .hasIssuesEnabled,
+  has_projects: .hasProjectsEnabled,
+  has_wiki: .hasWikiEnabled
+}'
 
 # Function to fetch all repositories with pagination
 fetch_all_repos() {
     local org="$1"
-    local page=1
-    local per_page=100
     local temp_file=$(mktemp)
+    local error_file=$(mktemp)
+    local retry_count=0
+    local archived="false"
+    local cache_args=()
     
-    echo "[]" > "$temp_file"
+    if [ "$REPO_LIST_CACHE_TTL" != "0" ]; then
+        cache_args=(--cache "$REPO_LIST_CACHE_TTL")
+    fi
+    
+    # Archived repositories are filtered server-side unless requested
+    if [ "$INCLUDE_ARCHIVED" != "false" ]; then
+        archived="null"
+    fi
     
     echo "Fetching repositories from organization: $org"
     
-    while true; do
-        echo -n "Fetching page $page... "
-        
-        # Fetch repositories for current page
-        local response=$(gh api \
-            -H "Accept: application/vnd.github+json" \
-            -H "X-GitHub-Api-Version: 2022-11-28" \
-            "/orgs/${org}/repos?per_page=${per_page}&page=${page}&type=all" 2>&1)
-        
+    # gh follows pageInfo.endCursor itself; --jq reduces each page to records as it arrives
+    until gh api graphql --paginate "${cache_args[@]}" \
+            --jq "$REPO_RECORD_JQ" \
+            -f query="$REPOS_QUERY" \
+            -f org="$org" \
+            -F archived="$archived" > "$temp_file" 2> "$error_file"; do
         # Check for rate limit
-        if echo "$response" | grep -q "rate limit"; then
-            handle_rate_limit 0 || exit 1
+        if grep -qi "rate limit" "$error_file"; then
+            handle_rate_limit $retry_count || exit 1
+            ((retry_count++))
             continue
         fi
         
-        # Check for errors
-        if echo "$response" | grep -q "error"; then
-            echo "Error: $response" >&2
-            rm -f "$temp_file"
-            exit 1
-        fi
-        
-        # Parse response
-        local repo_count=$(echo "$response" | jq 'length')
-        echo "$repo_count repositories"
-        
-        # Break if no more repositories
-        if [ "$repo_count" -eq 0 ]; then
-            break
-        fi
-        
-        # Filter and append to results
-        if [ "$INCLUDE_ARCHIVED" == "false" ]; then
-            # Exclude archived repositories
-            echo "$response" | jq '[.[] | select(.archived == false)]' > "${temp_file}.page"
-        else
-            echo "$response" | jq '.' > "${temp_file}.page"
-        fi
-        
-        # Merge with existing results
-        jq -s 'add' "$temp_file" "${temp_file}.page" > "${temp_file}.new"
-        mv "${temp_file}.new" "$temp_file"
-        rm -f "${temp_file}.page"
-        
-        # Increment page
-        ((page++))
-        
-        # Break if we got less than per_page (last page)
-        if [ "$repo_count" -lt "$per_page" ]; then
-            break
-        fi
+        echo "Error: $(cat "$error_file")" >&2
+        rm -f "$temp_file" "$error_file"
+        exit 1
     done
     
-    # Extract relevant fields and sort by activity
+    # Sort by activity; written compact since only scripts read it
     echo "Processing repository data..."
-    jq '[.[] | {
-        name: .name,
-        full_name: .full_name,
-        description: .description,
-        html_url: .html_url,
-        clone_url: .clone_url,
-        created_at: .created_at,
-        updated_at: .updated_at,
-        pushed_at: .pushed_at,
-        size: .size,
-        language: .language,
-        default_branch: .default_branch,
-        archived: .archived,
-        disabled: .disabled,
-        private: .private,
-        has_issues: .has_issues,
-        has_projects: .has_projects,
-        has_wiki: .has_wiki
-    }] | sort_by(.pushed_at) | reverse' "$temp_file" > "$OUTPUT_FILE"
+    jq -cs 'sort_by(.pushed_at) | reverse' "$temp_file" > "$OUTPUT_FILE"
     
-    rm -f "$temp_file"
+    rm -f "$temp_file" "$error_file"
 }
 
 # Main execution
@@ -107,10 +116,15 @@ main() {
     # Fetch repositories
     fetch_all_repos "$GITHUB_ORG"
     
-    # Summary
-    local total_repos=$(jq 'length' "$OUTPUT_FILE")
-    local active_repos=$(jq '[.[] | select(.archived == false)] | length' "$OUTPUT_FILE")
-    local languages=$(jq -r '[.[].language] | unique | map(select(. != null)) | join(", ")' "$OUTPUT_FILE")
+    # Summary, computed in a single pass over the output file
+    local total_repos active_repos languages
+    {
+        read -r total_repos
+        read -r active_repos
+        read -r languages
+    } < <(jq -r 'length,
+        ([.[] | select(.archived == false)] | length),
+        ([.[].language] | unique | map(select(. != null)) | join(", "))' "$OUTPUT_FILE")
     
     echo ""
     echo "Summary:"
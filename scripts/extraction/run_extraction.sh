@@ -131,29 +131,68 @@ if [ $? -ne 0 ]; then
 fi
 echo ""
 
-# Step 2: Extract PRs
-echo "Step 2: Extracting Pull Requests..."
+# Steps 2 and 3 only read repos.json, so PR and commit extraction run concurrently.
+# Their output is streamed as it happens, each line tagged with the step it came from.
+prefix_output() {
+    local prefix="$1"
+    local line
+    while IFS= read -r line || [ -n "$line" ]; do
+        printf '%s %s\n' "$prefix" "$line"
+    done
+}
+
+echo "Steps 2 and 3: Extracting Pull Requests and Commits..."
 echo "------------------------------------------"
-REPOS_FILE="${OUTPUT_DIR}/repos.json" \
-OUTPUT_FILE="${OUTPUT_DIR}/org_prs.csv" \
-"${SCRIPT_DIR}/extract_prs.sh"
-if [ $? -ne 0 ]; then
+
+# pipefail makes each background job report the extractor's status rather than the prefixer's
+(
+    set -o pipefail
+    REPOS_FILE="${OUTPUT_DIR}/repos.json" \
+    OUTPUT_FILE="${OUTPUT_DIR}/org_prs.csv" \
+    "${SCRIPT_DIR}/extract_prs.sh" 2>&1 | prefix_output "[prs]"
+) &
+PRS_PID=$!
+
+(
+    set -o pipefail
+    REPOS_FILE="${OUTPUT_DIR}/repos.json" \
+    OUTPUT_FILE="${OUTPUT_DIR}/org_commits.csv" \
+    "${SCRIPT_DIR}/extract_commits.sh" 2>&1 | prefix_output "[commits]"
+) &
+COMMITS_PID=$!
+
+# Don't leave an extractor running if this script fails or is interrupted
+kill_tree() {
+    # Collect children first; once the parent dies they are reparented out of reach
+    local children=$(pgrep -P "$1")
+    kill "$1" 2>/dev/null
+    local child
+    for child in $children; do
+        kill_tree "$child"
+    done
+}
+stop_extractors() {
+    kill_tree "$PRS_PID"
+    kill_tree "$COMMITS_PID"
+}
+trap stop_extractors EXIT
+trap 'exit 130' INT TERM
+
+wait "$PRS_PID"
+PRS_STATUS=$?
+wait "$COMMITS_PID"
+COMMITS_STATUS=$?
+trap - EXIT INT TERM
+echo ""
+
+if [ $PRS_STATUS -ne 0 ]; then
     echo "Error: Failed to extract PRs" >&2
     exit 1
 fi
-echo ""
-
-# Step 3: Extract commits
-echo "Step 3: Extracting Commits..."
-echo "------------------------------------------"
-REPOS_FILE="${OUTPUT_DIR}/repos.json" \
-OUTPUT_FILE="${OUTPUT_DIR}/org_commits.csv" \
-"${SCRIPT_DIR}/extract_commits.sh"
-if [ $? -ne 0 ]; then
+if [ $COMMITS_STATUS -ne 0 ]; then
     echo "Error: Failed to extract commits" >&2
     exit 1
 fi
-echo ""
 
 # Calculate execution time
 END_TIME=$(date +%s)
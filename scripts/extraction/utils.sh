@@ -49,6 +49,14 @@ show_progress() {
     printf "\r%-50s [%3d%%]" "$message" "$percent"
 }
 
+# Block until fewer than N background jobs are running
+wait_for_job_slot() {
+    local max_jobs="${1:-4}"
+    while [ "$(jobs -rp | wc -l | tr -d ' ')" -ge "$max_jobs" ]; do
+        sleep 0.2
+    done
+}
+
 # Rate limit handler with exponential backoff
 handle_rate_limit() {
     local retry_count="${1:-0}"
@@ -89,15 +97,19 @@ update_state() {
     local config_dir="${CONFIG_DIR:-config}"
     local state_file="${config_dir}/analysis_state.json"
     local current_date=$(date -u "+%Y-%m-%dT%H:%M:%SZ")
+    # Unique temp file so concurrent extractions never share one; mv keeps the swap atomic
+    local tmp_file=$(mktemp "${state_file}.XXXXXX")
     
     if [ -f "$state_file" ]; then
         # Update existing state file
-        jq --arg date "$current_date" '.last_run_date = $date' "$state_file" > "${state_file}.tmp" && \
-        mv "${state_file}.tmp" "$state_file"
+        jq --arg date "$current_date" '.last_run_date = $date' "$state_file" > "$tmp_file" && \
+        mv "$tmp_file" "$state_file"
     else
         # Create new state file
-        echo "{\"last_run_date\": \"$current_date\", \"processed_pr_ids\": [], \"processed_commit_shas\": [], \"total_records_processed\": 0}" > "$state_file"
+        echo "{\"last_run_date\": \"$current_date\", \"processed_pr_ids\": [], \"processed_commit_shas\": [], \"total_records_processed\": 0}" > "$tmp_file" && \
+        mv "$tmp_file" "$state_file"
     fi
+    rm -f "$tmp_file"
 }
 
 # Validate required environment variables
@@ -110,4 +122,4 @@ validate_env() {
 }
 
 # Export functions for use in other scripts
-export -f date_cmd format_date days_ago show_progress handle_rate_limit check_gh_auth load_config update_state validate_env
\ No newline at end of file
+export -f date_cmd format_date days_ago show_progress wait_for_job_slot handle_rate_limit check_gh_auth load_config update_state validate_env
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Main AI Analysis Engine combining all components."""
 
 import logging
+import threading
 import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
@@ -39,6 +40,7 @@ class AnalysisEngine:
         cache_size = min(
             cache_size or ProcessingLimits.CACHE_SIZE_DEFAULT, ProcessingLimits.CACHE_SIZE_MAX
         )
+        self._cache_lock = threading.Lock()
         self.results_cache = TTLCache(maxsize=cache_size, ttl=ProcessingLimits.CACHE_TTL_SECONDS)
 
         # Memory monitoring
@@ -76,12 +78,14 @@ class AnalysisEngine:
         """Get current memory statistics."""
         try:
             memory_info = psutil.virtual_memory()
+            with self._cache_lock:
+                cache_size = len(self.results_cache)
             return {
                 "total_mb": memory_info.total / (1024 * 1024),
                 "used_mb": memory_info.used / (1024 * 1024),
                 "available_mb": memory_info.available / (1024 * 1024),
                 "percent_used": memory_info.percent,
-                "cache_size": len(self.results_cache),
+                "cache_size": cache_size,
             }
         except (OSError, psutil.Error) as e:
             logger.debug(f"Failed to get memory stats: {e}")
@@ -90,6 +94,11 @@ class AnalysisEngine:
             logger.warning(f"Unexpected error getting memory stats: {e}")
             return {"error": "Unable to get memory stats"}
 
+    def _get_cached_result(self, cache_key: str) -> dict[str, Any] | None:
+        """Return the cached result for a context, or None on a miss."""
+        with self._cache_lock:
+            return self.results_cache.get(cache_key)
+
     def analyze_pr(
         self, pr_data: dict[str, Any], diff: str | None = None, use_cache: bool = True
     ) -> dict[str, Any]:
@@ -98,9 +107,11 @@ class AnalysisEngine:
         context = self.context_preparer.prepare_pr_context(pr_data, diff)
 
         # Check cache
-        if use_cache and context.cache_key in self.results_cache:
-            logger.debug(f"Using cached result for PR {context.metadata.get('pr_id')}")
-            return self.results_cache[context.cache_key]
+        if use_cache:
+            cached = self._get_cached_result(context.cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached result for PR {context.metadata.get('pr_id')}")
+                return cached
 
         # Create prompt
         prompt = self.prompt_engineer.create_analysis_prompt(
@@ -162,7 +173,8 @@ class AnalysisEngine:
 
             # Cache result
             if use_cache:
-                self.results_cache[context.cache_key] = result
+                with self._cache_lock:
+                    self.results_cache[context.cache_key] = result
 
             return result
 
@@ -208,9 +220,11 @@ class AnalysisEngine:
         context = self.context_preparer.prepare_commit_context(commit_data, diff)
 
         # Check cache
-        if use_cache and context.cache_key in self.results_cache:
-            logger.debug(f"Using cached result for commit {context.metadata.get('commit_sha')}")
-            return self.results_cache[context.cache_key]
+        if use_cache:
+            cached = self._get_cached_result(context.cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached result for commit {context.metadata.get('commit_sha')}")
+                return cached
 
         # Create prompt
         prompt = self.prompt_engineer.create_analysis_prompt(
@@ -272,7 +286,8 @@ class AnalysisEngine:
 
             # Cache result
             if use_cache:
-                self.results_cache[context.cache_key] = result
+                with self._cache_lock:
+                    self.results_cache[context.cache_key] = result
 
             return result
 
@@ -410,7 +425,8 @@ class AnalysisEngine:
     def get_stats(self) -> dict[str, Any]:
         """Get analysis statistics including memory usage."""
         stats = self.claude_client.get_usage_stats()
-        stats["cache_hits"] = len(self.results_cache)
+        with self._cache_lock:
+            stats["cache_hits"] = len(self.results_cache)
         stats["cache_maxsize"] = self.results_cache.maxsize
         stats["estimated_cost"] = self.claude_client.estimate_cost()
         stats["memory_stats"] = self._get_memory_stats()
@@ -420,9 +436,11 @@ class AnalysisEngine:
     def analyze(self, context: PreparedContext, use_cache: bool = True) -> dict[str, Any]:
         """Analyze prepared context (works for both PRs and commits)."""
         # Check cache
-        if use_cache and context.cache_key in self.results_cache:
-            logger.debug(f"Using cached result for context {context.cache_key}")
-            return self.results_cache[context.cache_key]
+        if use_cache:
+            cached = self._get_cached_result(context.cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached result for context {context.cache_key}")
+                return cached
 
         # Create prompt
         prompt = self.prompt_engineer.create_analysis_prompt(
@@ -439,7 +457,8 @@ class AnalysisEngine:
 
             # Cache result
             if use_cache:
-                self.results_cache[context.cache_key] = result
+                with self._cache_lock:
+                    self.results_cache[context.cache_key] = result
 
             logger.debug(f"Analysis complete for context {context.cache_key}")
             return result
@@ -466,5 +485,6 @@ class AnalysisEngine:
     def clear_cache(self):
         """Clear all caches."""
         self.claude_client.clear_cache()
-        self.results_cache.clear()
+        with self._cache_lock:
+            self.results_cache.clear()
         logger.info("All caches cleared")
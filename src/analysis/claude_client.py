@@ -1,12 +1,15 @@
 """Claude API client for AI-powered code analysis."""
 
 import logging
+import threading
 import time
 from typing import Any
 
 import backoff
 from anthropic import Anthropic
+from cachetools import LRUCache
 
+from ..config.constants import ProcessingLimits
 from ..security.key_manager import EnvironmentKeyManager, KeySecurityError, SecureKeyManager
 
 logger = logging.getLogger(__name__)
@@ -42,7 +45,8 @@ class ClaudeClient:
         self.client = Anthropic(api_key=self.api_key)
         self.total_tokens_used = 0
         self.total_api_calls = 0
-        self.cache = {}
+        self._cache_lock = threading.Lock()
+        self.cache = LRUCache(maxsize=ProcessingLimits.CACHE_SIZE_DEFAULT)
 
     @backoff.on_exception(
         backoff.expo, Exception, max_tries=MAX_RETRIES, jitter=backoff.full_jitter
@@ -57,9 +61,12 @@ class ClaudeClient:
     ) -> dict[str, Any]:
         """Send a prompt to Claude for code analysis."""
         # Check cache if key provided
-        if cache_key and cache_key in self.cache:
-            logger.debug(f"Cache hit for key: {cache_key}")
-            return self.cache[cache_key]
+        if cache_key:
+            with self._cache_lock:
+                cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Cache hit for key: %s", cache_key)
+                return cached
 
         try:
             messages = [{"role": "user", "content": prompt}]
@@ -74,9 +81,9 @@ class ClaudeClient:
             if system_prompt:
                 kwargs["system"] = system_prompt
 
-            start_time = time.time()
+            start_time = time.perf_counter()
             response = self.client.messages.create(**kwargs)
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
 
             self.total_api_calls += 1
 
@@ -106,16 +113,17 @@ class ClaudeClient:
 
             # Cache the result if key provided
             if cache_key:
-                self.cache[cache_key] = result
+                with self._cache_lock:
+                    self.cache[cache_key] = result
 
             logger.info(
-                f"API call completed in {elapsed_time:.2f}s, tokens used: {result['usage']}"
+                "API call completed in %.2fs, tokens used: %s", elapsed_time, result["usage"]
             )
 
             return result
 
         except Exception as e:
-            logger.error(f"Error calling Claude API: {str(e)}")
+            logger.error("Error calling Claude API: %s", e)
             raise
 
     def batch_analyze(
@@ -153,7 +161,7 @@ class ClaudeClient:
                 results.append(result)
 
             except Exception as e:
-                logger.error(f"Error analyzing item {idx + 1}/{total}: {str(e)}")
+                logger.error("Error analyzing item %d/%d: %s", idx + 1, total, e)
                 results.append({"error": str(e), "metadata": metadata})
 
             # Call progress callback if provided
@@ -177,7 +185,8 @@ class ClaudeClient:
 
     def clear_cache(self):
         """Clear the response cache."""
-        self.cache.clear()
+        with self._cache_lock:
+            self.cache.clear()
         logger.info("Cache cleared")
 
     def estimate_cost(self, input_tokens: int = None, output_tokens: int = None) -> float:
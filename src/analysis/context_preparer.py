@@ -3,8 +3,11 @@
 import hashlib
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+from ..config.constants import ProcessingLimits, ValidationLimits
+
 
 @dataclass
 class PreparedContext:
@@ -40,6 +43,31 @@ class ContextPreparer:
         re.compile(r"^[+-]\s*(@\w+|#\[|decorator)"),  # Decorators/attributes
         re.compile(r"^[+-]\s*(public|private|protected|static|final|const)\s+"),
     ]
+    # All important patterns as one alternation so each diff line is scanned once
+    IMPORTANT_LINE_PATTERN = re.compile("|".join(f"(?:{p.pattern})" for p in IMPORTANT_PATTERNS))
+
+    # AI assistance indicators, checked in order (more specific first)
+    AI_INDICATORS = (
+        ("co-authored-by: github copilot", "GitHub Copilot"),
+        ("co-authored-by: copilot", "GitHub Copilot"),
+        ("github copilot", "GitHub Copilot"),
+        ("generated with claude code", "Claude Code"),
+        ("🤖 generated with claude", "Claude Code"),
+        ("generated with claude", "Claude"),
+        ("generated by claude", "Claude"),
+        ("claude code", "Claude Code"),
+        ("cursor.ai", "Cursor"),
+        ("written with cursor", "Cursor"),
+        ("generated with cursor", "Cursor"),
+        ("co-authored-by: assistant", "Assistant"),
+        ("generated by ai", "Unknown AI Tool"),
+        ("ai assistant", "Unknown AI Tool"),
+        ("ai coding assistant", "Unknown AI Tool"),
+        ("ai-assisted", "Unknown AI Tool"),
+        ("ai assisted", "Unknown AI Tool"),
+        ("copilot", "GitHub Copilot"),
+        ("🤖", "Unknown AI Tool"),
+    )
 
     @staticmethod
     def prepare_pr_context(pr_data: dict[str, Any], diff: str | None = None) -> PreparedContext:
@@ -162,9 +190,7 @@ class ContextPreparer:
                 continue
 
             # Check if line matches important patterns
-            is_important = any(
-                pattern.match(line) for pattern in ContextPreparer.IMPORTANT_PATTERNS
-            )
+            is_important = ContextPreparer.IMPORTANT_LINE_PATTERN.match(line) is not None
 
             if is_important:
                 important_lines.append(line)
@@ -198,42 +224,34 @@ class ContextPreparer:
     @staticmethod
     def detect_ai_assistance(data: dict[str, Any]) -> tuple[bool, str | None]:
         """Detect if the work was done with AI assistance."""
-        # Check commit message or PR body for AI indicators
-        ai_indicators = [
-            ("co-authored-by: github copilot", "GitHub Copilot"),
-            ("co-authored-by: copilot", "GitHub Copilot"),
-            ("github copilot", "GitHub Copilot"),
-            ("generated with claude code", "Claude Code"),
-            ("🤖 generated with claude", "Claude Code"),
-            ("generated with claude", "Claude"),
-            ("generated by claude", "Claude"),
-            ("claude code", "Claude Code"),
-            ("cursor.ai", "Cursor"),
-            ("written with cursor", "Cursor"),
-            ("generated with cursor", "Cursor"),
-            ("co-authored-by: assistant", "Assistant"),
-            ("generated by ai", "Unknown AI Tool"),
-            ("ai assistant", "Unknown AI Tool"),
-            ("ai coding assistant", "Unknown AI Tool"),
-            ("ai-assisted", "Unknown AI Tool"),
-            ("ai assisted", "Unknown AI Tool"),
-            ("copilot", "GitHub Copilot"),
-            ("🤖", "Unknown AI Tool"),
-        ]
-
         # Check in commit message
         message = data.get("commit", {}).get("message", "") or data.get("message", "")
         body = data.get("body", "")
 
-        combined_text = f"{message} {body}".lower()
+        return ContextPreparer._match_ai_indicators(
+            ContextPreparer._bound_text(f"{message} {body}")
+        )
 
-        # Check indicators in order (more specific first)
-        for indicator_text, tool_name in ai_indicators:
+    @staticmethod
+    @lru_cache(maxsize=ProcessingLimits.CACHE_SIZE_DEFAULT)
+    def _match_ai_indicators(text: str) -> tuple[bool, str | None]:
+        """Match AI indicators in text, memoized since bot and template messages recur."""
+        combined_text = text.lower()
+
+        for indicator_text, tool_name in ContextPreparer.AI_INDICATORS:
             if indicator_text in combined_text:
                 return True, tool_name
 
         return False, None
 
+    @staticmethod
+    def _bound_text(text: str, limit: int = ValidationLimits.SCAN_TEXT_MAX_LENGTH) -> str:
+        """Bound text for scanning, keeping both ends where AI trailers usually appear."""
+        if len(text) <= limit:
+            return text
+        half = limit // 2
+        return f"{text[:half]}\n{text[-half:]}"
+
     @staticmethod
     def extract_linear_ticket_id(data: dict[str, Any]) -> str | None:
         """Extract Linear ticket ID from PR/commit data."""
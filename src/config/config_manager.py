@@ -1,5 +1,6 @@
 """Configuration management for the North Star project."""
 
+import copy
 import json
 from datetime import UTC, datetime
 from typing import Any
@@ -10,6 +11,7 @@ from ..exceptions import (
     JSONProcessingError,
 )
 from ..validation.input_validator import InputValidator, ValidationError
+from .state_manager import write_json_atomic
 
 
 class ConfigManager:
@@ -30,15 +32,28 @@ class ConfigManager:
         # Create config directory if it doesn't exist
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
+        # Parsed AI developers config keyed by the file's (mtime_ns, size)
+        self._ai_developers_cache: tuple[tuple[int, int], dict[str, Any]] | None = None
+
     def load_ai_developers(self) -> dict[str, list[dict[str, Any]]]:
         """Load AI developers configuration from file."""
+        return copy.deepcopy(self._get_ai_developers())
+
+    def _get_ai_developers(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the parsed AI developers config, re-reading only when the file changes."""
         if not self.ai_developers_file.exists():
             return {"always_ai_developers": []}
 
         try:
+            stat = self.ai_developers_file.stat()
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            if self._ai_developers_cache and self._ai_developers_cache[0] == cache_key:
+                return self._ai_developers_cache[1]
+
             with open(self.ai_developers_file) as f:
                 data = json.load(f)
                 self._validate_ai_developers_config(data)
+                self._ai_developers_cache = (cache_key, data)
                 return data
         except json.JSONDecodeError as e:
             raise JSONProcessingError(
@@ -58,8 +73,8 @@ class ConfigManager:
         """Save AI developers configuration to file."""
         self._validate_ai_developers_config(config)
 
-        with open(self.ai_developers_file, "w") as f:
-            json.dump(config, f, indent=2)
+        write_json_atomic(self.ai_developers_file, config, indent=2)
+        self._ai_developers_cache = None
 
     def _validate_ai_developers_config(self, config: dict[str, Any]) -> None:
         """Validate AI developers configuration structure."""
@@ -142,8 +157,7 @@ class ConfigManager:
         """Save analysis state to file."""
         self._validate_analysis_state(state)
 
-        with open(self.state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        write_json_atomic(self.state_file, state, indent=2)
 
     def _validate_analysis_state(self, state: dict[str, Any]) -> None:
         """Validate analysis state structure."""
@@ -230,12 +244,12 @@ class ConfigManager:
         self, username: str | None = None, email: str | None = None
     ) -> dict[str, Any] | None:
         """Get AI developer info by username or email."""
-        config = self.load_ai_developers()
+        config = self._get_ai_developers()
 
         for dev in config["always_ai_developers"]:
             if (username and dev["username"].lower() == username.lower()) or (
                 email and dev["email"].lower() == email.lower()
             ):
-                return dev
+                return dict(dev)
 
         return None
@@ -45,6 +45,7 @@ class ValidationLimits:
     DESCRIPTION_MAX_LENGTH: Final[int] = 2000
     FILENAME_MAX_LENGTH: Final[int] = 200
     EMAIL_MAX_LENGTH: Final[int] = 254
+    SCAN_TEXT_MAX_LENGTH: Final[int] = 20000  # Text scanned for tickets/AI markers
 
     # Numeric ranges
     SCORE_MIN: Final[int] = 1
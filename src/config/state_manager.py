@@ -1,7 +1,11 @@
 """State management for tracking processed records and incremental updates."""
 
+import copy
 import json
 import logging
+import os
+import stat
+import uuid
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -9,12 +13,31 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
+def write_json_atomic(path: Path, data: Any, indent: int | None = None) -> None:
+    """Write JSON via a sibling temp file so readers never see a partially written file."""
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    # Created with 0666 like open(), so new files get the umask default rather than 0600
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w") as f:
+            if path.exists():
+                # os.replace keeps the temp file's mode, so carry over the existing one
+                os.fchmod(f.fileno(), stat.S_IMODE(path.stat().st_mode))
+            json.dump(data, f, indent=indent)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class StateManager:
     """Manages the analysis state for incremental processing."""
 
     def __init__(self, state_file: str = "config/analysis_state.json"):
         """Initialize the StateManager with a state file path."""
         self.state_file = Path(state_file)
+        # Parsed state keyed by the file's (mtime_ns, size)
+        self._state_cache: tuple[tuple[int, int], dict[str, Any]] | None = None
         self._ensure_state_file_exists()
 
     def _ensure_state_file_exists(self) -> None:
@@ -30,10 +53,21 @@ class StateManager:
             self._save_state(default_state)
 
     def _load_state(self) -> dict[str, Any]:
-        """Load the current state from file."""
+        """Load a mutable copy of the current state."""
+        return copy.deepcopy(self._get_state())
+
+    def _get_state(self) -> dict[str, Any]:
+        """Return the parsed state, re-reading only when the file changes."""
         try:
+            stat = self.state_file.stat()
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            if self._state_cache and self._state_cache[0] == cache_key:
+                return self._state_cache[1]
+
             with open(self.state_file) as f:
-                return json.load(f)
+                state = json.load(f)
+            self._state_cache = (cache_key, state)
+            return state
         except Exception as e:
             logger.error(f"Error loading state file: {e}")
             raise
@@ -41,19 +75,23 @@ class StateManager:
     def _save_state(self, state: dict[str, Any]) -> None:
         """Save the state to file."""
         try:
-            with open(self.state_file, "w") as f:
-                json.dump(state, f, indent=2)
+            write_json_atomic(self.state_file, state, indent=2)
+            self._state_cache = None
         except Exception as e:
             logger.error(f"Error saving state file: {e}")
             raise
 
-    def get_last_run_date(self) -> datetime | None:
-        """Get the last run date as a datetime object."""
-        state = self._load_state()
+    @staticmethod
+    def _parse_last_run_date(state: dict[str, Any]) -> datetime | None:
+        """Parse the last run date out of an already loaded state."""
         if state["last_run_date"]:
             return datetime.fromisoformat(state["last_run_date"].replace("Z", "+00:00"))
         return None
 
+    def get_last_run_date(self) -> datetime | None:
+        """Get the last run date as a datetime object."""
+        return self._parse_last_run_date(self._get_state())
+
     def get_date_range_for_incremental_update(
         self, default_days: int = 7
     ) -> tuple[datetime, datetime]:
@@ -72,13 +110,11 @@ class StateManager:
 
     def get_processed_pr_ids(self) -> set[str]:
         """Get the set of processed PR IDs."""
-        state = self._load_state()
-        return set(state["processed_pr_ids"])
+        return set(self._get_state()["processed_pr_ids"])
 
     def get_processed_commit_shas(self) -> set[str]:
         """Get the set of processed commit SHAs."""
-        state = self._load_state()
-        return set(state["processed_commit_shas"])
+        return set(self._get_state()["processed_commit_shas"])
 
     def is_pr_processed(self, pr_id: str) -> bool:
         """Check if a PR has been processed."""
@@ -133,8 +169,8 @@ class StateManager:
 
     def get_statistics(self) -> dict[str, Any]:
         """Get statistics about the current state."""
-        state = self._load_state()
-        last_run = self.get_last_run_date()
+        state = self._get_state()
+        last_run = self._parse_last_run_date(state)
 
         return {
             "last_run_date": last_run.isoformat() if last_run else None,
@@ -1,17 +1,39 @@
 """Developer metrics aggregation functionality for weekly developer performance tracking."""
 
 import logging
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
-logger = logging.getLogger(__name__)
+from ..config.constants import ProcessingLimits
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Low-cardinality unified data columns stored as categoricals to shrink memory
+UNIFIED_CATEGORY_DTYPES = {
+    "author": "category",
+    "source_type": "category",
+}
+
+# Unified data columns used by metrics aggregation and the AI usage breakdown
+UNIFIED_METRICS_COLUMNS = frozenset(
+    {
+        "date",
+        "author",
+        "source_type",
+        "ai_assisted",
+        "ai_tool_type",
+        "files_changed",
+        "complexity_score",
+        "impact_score",
+    }
+)
+
+
+@dataclass(slots=True)
 class DeveloperMetrics:
     """Developer metrics model as specified in the PRD."""
 
@@ -26,7 +48,7 @@ class DeveloperMetrics:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for CSV output."""
-        return asdict(self)
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class DeveloperMetricsAggregator:
@@ -51,18 +73,8 @@ class DeveloperMetricsAggregator:
             self.logger.warning("No unified data to process for developer metrics")
             return 0
 
-        # Group data by author and week
-        grouped_data = self._group_by_author_and_week(df)
-
-        # Calculate metrics for each group
-        developer_metrics = []
-        for (author, week_period), group_df in grouped_data:
-            try:
-                metrics = self._calculate_developer_metrics(author, week_period, group_df)
-                developer_metrics.append(metrics)
-            except Exception as e:
-                self.logger.error(f"Error calculating metrics for {author} in {week_period}: {e}")
-                continue
+        # Calculate metrics for all author-week combinations in one grouped pass
+        developer_metrics = self._calculate_all_developer_metrics(df)
 
         # Save metrics to output file
         records_written = self._save_developer_metrics(developer_metrics, output_file, incremental)
@@ -80,12 +92,20 @@ class DeveloperMetricsAggregator:
                 self.logger.warning(f"File {filename} does not exist")
                 return pd.DataFrame()
 
-            df = pd.read_csv(file_path)
+            # Only parse the columns metrics need; the analysis text columns are the bulk
+            df = pd.read_csv(
+                file_path,
+                usecols=lambda column: column in UNIFIED_METRICS_COLUMNS,
+                dtype=UNIFIED_CATEGORY_DTYPES,
+            )
             self.logger.info(f"Loaded {len(df)} records from {filename}")
 
+            if "files_changed" in df.columns:
+                df["files_changed"] = pd.to_numeric(df["files_changed"], downcast="integer")
+
             # Ensure date column is datetime
             if "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"])
+                df["date"] = pd.to_datetime(df["date"], format="ISO8601")
 
             return df
         except Exception as e:
@@ -97,52 +117,58 @@ class DeveloperMetricsAggregator:
         # Add week period column in YYYY-Wnn format
         df["week_period"] = df["date"].dt.strftime("%Y-W%U")
 
-        # Group by author and week period
-        grouped = df.groupby(["author", "week_period"])
+        # Group by author and week period, skipping unused category combinations
+        grouped = df.groupby(["author", "week_period"], observed=True)
 
         self.logger.info(f"Grouped data into {len(grouped)} author-week combinations")
         return grouped
 
-    def _calculate_developer_metrics(
-        self, author: str, week_period: str, group_df: pd.DataFrame
-    ) -> DeveloperMetrics:
-        """Calculate metrics for a single author-week combination."""
-
-        # Calculate commit frequency (commits per day average)
-        # Assuming 7 days per week, count unique commit source types
-        commit_count = len(group_df[group_df["source_type"] == "Commit"])
-        commit_frequency = commit_count / 7.0  # commits per day
-
-        # Calculate PR frequency (PRs per week)
-        pr_count = len(group_df[group_df["source_type"] == "PR"])
-        pr_frequency = float(pr_count)  # already per week
-
-        # Calculate AI usage rate (percentage of AI-assisted work)
-        total_work = len(group_df)
-        ai_assisted_work = len(group_df[group_df["ai_assisted"] == True])
-        ai_usage_rate = (ai_assisted_work / total_work * 100) if total_work > 0 else 0.0
-
-        # Calculate average PR size (average files changed per PR)
-        pr_data = group_df[group_df["source_type"] == "PR"]
-        avg_pr_size = pr_data["files_changed"].mean() if not pr_data.empty else 0.0
-
-        # Calculate average complexity score
-        avg_complexity = group_df["complexity_score"].mean()
-
-        # Calculate average impact score
-        avg_impact_score = group_df["impact_score"].mean()
-
-        return DeveloperMetrics(
-            author=author,
-            period=week_period,
-            commit_frequency=round(commit_frequency, 3),
-            pr_frequency=round(pr_frequency, 1),
-            ai_usage_rate=round(ai_usage_rate, 1),
-            avg_pr_size=round(avg_pr_size, 1),
-            avg_complexity=round(avg_complexity, 2),
-            avg_impact_score=round(avg_impact_score, 2),
+    def _calculate_all_developer_metrics(self, df: pd.DataFrame) -> list[DeveloperMetrics]:
+        """Calculate metrics for every author-week combination with a single aggregation."""
+        is_pr = df["source_type"] == "PR"
+        df = df.assign(
+            is_commit=df["source_type"] == "Commit",
+            is_pr=is_pr,
+            is_ai=df["ai_assisted"] == True,
+            pr_files_changed=df["files_changed"].where(is_pr),
+        )
+
+        summary = self._group_by_author_and_week(df).agg(
+            commit_count=("is_commit", "sum"),
+            pr_count=("is_pr", "sum"),
+            ai_count=("is_ai", "sum"),
+            total_work=("is_ai", "size"),
+            avg_pr_size=("pr_files_changed", "mean"),
+            avg_complexity=("complexity_score", "mean"),
+            avg_impact_score=("impact_score", "mean"),
         )
 
+        # Derive rates column-wise rather than per group
+        metrics_df = pd.DataFrame(
+            {
+                "commit_frequency": (summary["commit_count"] / 7.0).round(3),
+                "pr_frequency": summary["pr_count"].astype(float).round(1),
+                "ai_usage_rate": (summary["ai_count"] / summary["total_work"] * 100).round(1),
+                "avg_pr_size": summary["avg_pr_size"].where(summary["pr_count"] > 0, 0.0).round(1),
+                "avg_complexity": summary["avg_complexity"].round(2),
+                "avg_impact_score": summary["avg_impact_score"].round(2),
+            }
+        ).reset_index()
+
+        return [
+            DeveloperMetrics(
+                author=row.author,
+                period=row.week_period,
+                commit_frequency=float(row.commit_frequency),
+                pr_frequency=float(row.pr_frequency),
+                ai_usage_rate=float(row.ai_usage_rate),
+                avg_pr_size=float(row.avg_pr_size),
+                avg_complexity=float(row.avg_complexity),
+                avg_impact_score=float(row.avg_impact_score),
+            )
+            for row in metrics_df.itertuples(index=False)
+        ]
+
     def _save_developer_metrics(
         self, metrics: list[DeveloperMetrics], output_file: str, incremental: bool
     ) -> int:
@@ -172,10 +198,8 @@ class DeveloperMetricsAggregator:
         output_path = Path(output_file)
 
         if incremental and output_path.exists():
-            # Load existing data to check for duplicates
-            existing_df = pd.read_csv(output_path)
             # Remove duplicates based on author and period
-            existing_keys = set(zip(existing_df["author"], existing_df["period"], strict=False))
+            existing_keys = self._load_existing_keys(output_path)
             new_metrics = [m for m in metrics if (m.author, m.period) not in existing_keys]
 
             if new_metrics:
@@ -195,6 +219,18 @@ class DeveloperMetricsAggregator:
             self.logger.info(f"Created {output_file} with {len(metrics)} developer metrics")
             return len(metrics)
 
+    def _load_existing_keys(self, output_path: Path) -> set[tuple[str, str]]:
+        """Load (author, period) keys from an existing metrics file without reading every column."""
+        existing_keys = set()
+        for chunk in pd.read_csv(
+            output_path,
+            usecols=["author", "period"],
+            dtype=str,
+            chunksize=ProcessingLimits.CSV_CHUNK_SIZE,
+        ):
+            existing_keys.update(zip(chunk["author"], chunk["period"], strict=True))
+        return existing_keys
+
     def get_ai_usage_breakdown(
         self, unified_data_file: str = "unified_pilot_data.csv"
     ) -> dict[str, dict[str, float]]:
@@ -2,8 +2,14 @@
 
 import json
 import logging
-from dataclasses import asdict, dataclass
+import re
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -11,15 +17,30 @@ import pandas as pd
 
 from ..analysis.analysis_engine import AnalysisEngine
 from ..analysis.context_preparer import ContextPreparer
+from ..config.constants import ProcessingLimits
 from ..config.state_manager import StateManager
-from ..linear.linear_client import LinearClient
+from ..linear.linear_client import LinearClient, LinearClientCancelledError
 from ..linear.pr_matcher import PRTicketMatcher
 from .developer_metrics import DeveloperMetricsAggregator
 
 logger = logging.getLogger(__name__)
 
+# GitHub's UTC timestamp shape, e.g. 2025-01-02T03:04:05Z
+GITHUB_UTC_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z")
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality strings so repeated values share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _flag_rate(flags: pd.Series) -> float:
+    """Mean of a nullable boolean column as a plain float, NaN when no flag is set."""
+    rate = flags.mean()
+    return float("nan") if pd.isna(rate) else float(rate)
+
+
+@dataclass(slots=True)
 class UnifiedRecord:
     """Unified data model for analysis output."""
 
@@ -46,7 +67,8 @@ class UnifiedRecord:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for CSV output."""
-        return asdict(self)
+        # Called once per output row; asdict would deep-copy every field
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class UnifiedDataProcessor:
@@ -101,36 +123,39 @@ class UnifiedDataProcessor:
         """Process and unify all data sources."""
         logger.info("Starting unified data processing")
 
-        # Load data
+        # Load PR data up front; it is needed to deduplicate commits
         prs_df = self._load_csv_data(pr_data_file)
-        commits_df = self._load_csv_data(commit_data_file)
-
-        if prs_df.empty and commits_df.empty:
-            logger.warning("No data to process")
-            return 0
-
-        # Apply incremental filtering if enabled
+        prs_loaded = len(prs_df)
         if incremental:
             prs_df = self._filter_incremental_prs(prs_df)
-            commits_df = self._filter_incremental_commits(commits_df)
-
-        logger.info(f"Processing {len(prs_df)} PRs and {len(commits_df)} commits")
 
         # Process PRs (high-context data)
         pr_records = []
         if not prs_df.empty:
             pr_records = self._process_prs(prs_df)
 
-        # Process commits (low-context data)
-        commit_records = []
-        if not commits_df.empty:
-            commit_records = self._process_commits(commits_df, prs_df)
+        # Stream commits (low-context data) chunk by chunk instead of loading the whole file
+        pr_commits = self._get_pr_commit_shas(prs_df)
+        commit_chunks = []
+        commits_loaded = 0
+        commits_processed = 0
+        for commits_df in self._load_csv_chunks(commit_data_file):
+            commits_loaded += len(commits_df)
+            if incremental:
+                commits_df = self._filter_incremental_commits(commits_df)
+            if not commits_df.empty:
+                commits_processed += len(commits_df)
+                commit_chunks.append(self._process_commits(commits_df, pr_commits))
+        commit_records = list(chain.from_iterable(commit_chunks))
+
+        if prs_loaded == 0 and commits_loaded == 0:
+            logger.warning("No data to process")
+            return 0
 
-        # Combine all records
-        all_records = pr_records + commit_records
+        logger.info(f"Processed {len(prs_df)} PRs and {commits_processed} commits")
 
-        # Sort by date
-        all_records.sort(key=lambda r: r.date)
+        # Combine all records, sorted by date, in a single list build
+        all_records = sorted(chain(pr_records, commit_records), key=attrgetter("date"))
 
         # Save to output file
         records_written = self._save_unified_data(all_records, output_file, incremental)
@@ -172,6 +197,19 @@ class UnifiedDataProcessor:
             logger.error(f"Error loading {filename}: {e}")
             return pd.DataFrame()
 
+    def _load_csv_chunks(self, filename: str) -> Iterator[pd.DataFrame]:
+        """Load CSV data in chunks with error handling."""
+        if not Path(filename).exists():
+            logger.warning(f"File {filename} does not exist")
+            return
+
+        try:
+            yield from pd.read_csv(filename, chunksize=ProcessingLimits.CSV_CHUNK_SIZE)
+        except pd.errors.EmptyDataError:
+            logger.warning(f"Empty CSV file: {filename}")
+        except Exception as e:
+            logger.error(f"Error loading {filename}: {e}")
+
     def _filter_incremental_prs(self, prs_df: pd.DataFrame) -> pd.DataFrame:
         """Filter PRs for incremental processing."""
         if prs_df.empty:
@@ -212,59 +250,47 @@ class UnifiedDataProcessor:
     def _process_prs(self, prs_df: pd.DataFrame) -> list[UnifiedRecord]:
         """Process PR data into unified records."""
         logger.info("Processing PR data")
-        records = []
-
-        for _, row in prs_df.iterrows():
-            try:
-                # Convert row to dict for processing
-                pr_data = row.to_dict()
 
-                # Prepare context for analysis
-                context = self.context_preparer.prepare_pr_context(pr_data)
+        rows = prs_df.to_dict("records")
+        records = self._process_rows(rows, self._process_pr_row, "PR", "id")
 
-                # Get AI analysis if engine is available
-                analysis_result = None
-                if self.analysis_engine:
-                    analysis_result = self.analysis_engine.analyze(context)
-
-                # Match with Linear tickets
-                ticket_match = None
-                if self.pr_matcher:
-                    ticket_match = self.pr_matcher.match_pr(pr_data)
+        logger.info(f"Processed {len(records)} PR records")
+        return records
 
-                # Detect AI assistance
-                ai_assisted, ai_tool = self._detect_ai_assistance(
-                    pr_data, context.metadata.get("author", "")
-                )
+    def _process_pr_row(self, pr_data: dict[str, Any]) -> UnifiedRecord:
+        """Process a single PR row into a unified record."""
+        # Prepare context for analysis
+        context = self.context_preparer.prepare_pr_context(pr_data)
 
-                # Create unified record
-                record = self._create_unified_record(
-                    data=pr_data,
-                    context=context,
-                    analysis=analysis_result,
-                    ticket_match=ticket_match,
-                    ai_assisted=ai_assisted,
-                    ai_tool=ai_tool,
-                    source_type="PR",
-                    context_level="High",
-                )
+        # Get AI analysis if engine is available
+        analysis_result = None
+        if self.analysis_engine:
+            analysis_result = self.analysis_engine.analyze(context)
 
-                records.append(record)
+        # Match with Linear tickets
+        ticket_match = None
+        if self.pr_matcher:
+            ticket_match = self.pr_matcher.match_pr(pr_data)
 
-            except Exception as e:
-                logger.error(f"Error processing PR {row.get('id', 'unknown')}: {e}")
-                continue
-
-        logger.info(f"Processed {len(records)} PR records")
-        return records
+        # Detect AI assistance
+        ai_assisted, ai_tool = self._detect_ai_assistance(
+            pr_data, context.metadata.get("author", "")
+        )
 
-    def _process_commits(
-        self, commits_df: pd.DataFrame, prs_df: pd.DataFrame
-    ) -> list[UnifiedRecord]:
-        """Process commit data, removing duplicates that are part of PRs."""
-        logger.info("Processing commit data with deduplication")
+        # Create unified record
+        return self._create_unified_record(
+            data=pr_data,
+            context=context,
+            analysis=analysis_result,
+            ticket_match=ticket_match,
+            ai_assisted=ai_assisted,
+            ai_tool=ai_tool,
+            source_type="PR",
+            context_level="High",
+        )
 
-        # Get commit SHAs that are part of PRs for deduplication
+    def _get_pr_commit_shas(self, prs_df: pd.DataFrame) -> set[str]:
+        """Get commit SHAs that are part of PRs for deduplication."""
         pr_commits = set()
         if not prs_df.empty and "commits" in prs_df.columns:
             for commits_data in prs_df["commits"].dropna():
@@ -276,58 +302,99 @@ class UnifiedDataProcessor:
                         )
                     except json.JSONDecodeError:
                         continue
+        return pr_commits
 
-        records = []
+    def _process_commits(
+        self, commits_df: pd.DataFrame, pr_commits: set[str]
+    ) -> list[UnifiedRecord]:
+        """Process commit data, removing duplicates that are part of PRs."""
+        logger.info("Processing commit data with deduplication")
+
+        # Skip commits that are part of PRs
         deduplicated_count = 0
+        if pr_commits and "sha" in commits_df.columns:
+            in_pr = commits_df["sha"].isin(pr_commits)
+            deduplicated_count = int(in_pr.sum())
+            commits_df = commits_df[~in_pr]
 
-        for _, row in commits_df.iterrows():
-            try:
-                commit_data = row.to_dict()
-                commit_sha = commit_data.get("sha", "")
+        rows = commits_df.to_dict("records")
+        records = self._process_rows(rows, self._process_commit_row, "commit", "sha")
 
-                # Skip commits that are part of PRs
-                if commit_sha in pr_commits:
-                    deduplicated_count += 1
-                    continue
+        logger.info(
+            f"Processed {len(records)} commit records, deduplicated {deduplicated_count} PR commits"
+        )
+        return records
 
-                # Prepare context for analysis
-                context = self.context_preparer.prepare_commit_context(commit_data)
+    def _process_commit_row(self, commit_data: dict[str, Any]) -> UnifiedRecord:
+        """Process a single commit row into a unified record."""
+        # Prepare context for analysis
+        context = self.context_preparer.prepare_commit_context(commit_data)
 
-                # Get AI analysis if engine is available
-                analysis_result = None
-                if self.analysis_engine:
-                    analysis_result = self.analysis_engine.analyze(context)
+        # Get AI analysis if engine is available
+        analysis_result = None
+        if self.analysis_engine:
+            analysis_result = self.analysis_engine.analyze(context)
 
-                # Detect AI assistance
-                ai_assisted, ai_tool = self._detect_ai_assistance(
-                    commit_data, context.metadata.get("author", "")
-                )
+        # Detect AI assistance
+        ai_assisted, ai_tool = self._detect_ai_assistance(
+            commit_data, context.metadata.get("author", "")
+        )
 
-                # Extract Linear ticket ID if present
-                linear_ticket_id = self.context_preparer.extract_linear_ticket_id(commit_data)
-
-                # Create unified record
-                record = self._create_unified_record(
-                    data=commit_data,
-                    context=context,
-                    analysis=analysis_result,
-                    ticket_match=None,
-                    ai_assisted=ai_assisted,
-                    ai_tool=ai_tool,
-                    source_type="Commit",
-                    context_level="Low",
-                    linear_ticket_id=linear_ticket_id,
-                )
+        # Extract Linear ticket ID if present
+        linear_ticket_id = self.context_preparer.extract_linear_ticket_id(commit_data)
 
-                records.append(record)
+        # Create unified record
+        return self._create_unified_record(
+            data=commit_data,
+            context=context,
+            analysis=analysis_result,
+            ticket_match=None,
+            ai_assisted=ai_assisted,
+            ai_tool=ai_tool,
+            source_type="Commit",
+            context_level="Low",
+            linear_ticket_id=linear_ticket_id,
+        )
 
-            except Exception as e:
-                logger.error(f"Error processing commit {row.get('sha', 'unknown')}: {e}")
-                continue
+    def _process_rows(
+        self,
+        rows: list[dict[str, Any]],
+        process_row: Callable[[dict[str, Any]], UnifiedRecord],
+        label: str,
+        id_field: str,
+    ) -> list[UnifiedRecord]:
+        """Process rows concurrently, preserving input order and skipping failed rows."""
+        if not rows:
+            return []
 
-        logger.info(
-            f"Processed {len(records)} commit records, deduplicated {deduplicated_count} PR commits"
+        # Analysis and ticket lookups are I/O bound, so fan out across the engine's workers
+        max_workers = getattr(
+            self.analysis_engine, "max_workers", ProcessingLimits.MAX_WORKERS_DEFAULT
         )
+
+        records = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(rows)))) as executor:
+            futures = [(executor.submit(process_row, row), row) for row in rows]
+
+            try:
+                # Collect in submission order so output matches input order
+                for future, row in futures:
+                    try:
+                        records.append(future.result())
+                    except LinearClientCancelledError:
+                        raise
+                    except Exception as e:
+                        logger.error(
+                            f"Error processing {label} {row.get(id_field, 'unknown')}: {e}"
+                        )
+                        continue
+            except BaseException:
+                # Drop queued rows and wake workers sleeping on Linear rate limits
+                executor.shutdown(wait=False, cancel_futures=True)
+                if self.linear_client:
+                    self.linear_client.cancel()
+                raise
+
         return records
 
     def _detect_ai_assistance(self, data: dict[str, Any], author: str) -> tuple[bool, str | None]:
@@ -405,13 +472,13 @@ class UnifiedDataProcessor:
             process_compliant = True  # Assume compliance if ticket ID found
 
         return UnifiedRecord(
-            repository=repository,
+            repository=_intern(repository),
             date=date,
-            author=author,
+            author=_intern(author),
             source_type=source_type,
             source_url=source_url,
             context_level=context_level,
-            work_type=work_type,
+            work_type=_intern(work_type),
             complexity_score=complexity_score,
             risk_score=risk_score,
             clarity_score=clarity_score,
@@ -421,8 +488,8 @@ class UnifiedDataProcessor:
             files_changed=int(files_changed),
             impact_score=round(impact_score, 2),
             ai_assisted=ai_assisted,
-            ai_tool_type=ai_tool,
-            linear_ticket_id=ticket_id,
+            ai_tool_type=_intern(ai_tool),
+            linear_ticket_id=_intern(ticket_id),
             has_linear_ticket=has_ticket,
             process_compliant=process_compliant,
         )
@@ -450,6 +517,9 @@ class UnifiedDataProcessor:
             date_str = data.get("committed_at") or data.get("created_at")
 
         if date_str:
+            # GitHub timestamps only need their Z suffix spelled as an offset
+            if GITHUB_UTC_TIMESTAMP_RE.fullmatch(date_str):
+                return f"{date_str[:-1]}+00:00"
             try:
                 # Parse and convert to ISO format
                 dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
@@ -486,9 +556,6 @@ class UnifiedDataProcessor:
             logger.warning("No records to save")
             return 0
 
-        # Convert to DataFrame
-        df = pd.DataFrame([record.to_dict() for record in records])
-
         # Ensure proper column order
         column_order = [
             "repository",
@@ -513,7 +580,9 @@ class UnifiedDataProcessor:
             "process_compliant",
         ]
 
-        df = df.reindex(columns=column_order)
+        # Build rows straight from record attributes, skipping a dict per record
+        row_values = attrgetter(*column_order)
+        df = pd.DataFrame.from_records(map(row_values, records), columns=column_order)
 
         # Save to file
         output_path = Path(output_file)
@@ -534,7 +603,15 @@ class UnifiedDataProcessor:
     ) -> dict[str, Any]:
         """Validate the integrity of processed data."""
         try:
-            df = pd.read_csv(output_file)
+            # Flag columns as nullable booleans so rates reduce over a typed array
+            df = pd.read_csv(
+                output_file,
+                dtype={
+                    "ai_assisted": "boolean",
+                    "has_linear_ticket": "boolean",
+                    "process_compliant": "boolean",
+                },
+            )
 
             validation_results = {
                 "total_records": len(df),
@@ -569,8 +646,8 @@ class UnifiedDataProcessor:
             validation_results["summary_stats"] = {
                 "source_types": df["source_type"].value_counts().to_dict(),
                 "work_types": df["work_type"].value_counts().to_dict(),
-                "ai_assisted_rate": df["ai_assisted"].mean(),
-                "process_compliance_rate": df["process_compliant"].mean(),
+                "ai_assisted_rate": _flag_rate(df["ai_assisted"]),
+                "process_compliance_rate": _flag_rate(df["process_compliant"]),
                 "avg_impact_score": df["impact_score"].mean(),
             }
 
@@ -1,19 +1,76 @@
 """Linear API client for interacting with Linear GraphQL API."""
 
 import logging
+import threading
 import time
 from datetime import datetime
-from functools import lru_cache
 from typing import Any
 
 import requests
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
 
+from ..config.constants import ProcessingLimits
 from ..security.key_manager import EnvironmentKeyManager, KeySecurityError, SecureKeyManager
 from ..validation.graphql_validator import GraphQLValidator, ValidationError
 
 logger = logging.getLogger(__name__)
 
 
+class LinearClientCancelledError(Exception):
+    """Raised when a request is attempted or waiting after the client was cancelled."""
+
+
+# Distinguishes a cache miss from a cached "issue not found" (None)
+_MISSING = object()
+
+# Issue fields shared by single and batched issue lookups
+_ISSUE_FIELDS = """
+    id
+    identifier
+    title
+    description
+    state {
+        id
+        name
+        type
+    }
+    assignee {
+        id
+        name
+        email
+    }
+    creator {
+        id
+        name
+        email
+    }
+    createdAt
+    updatedAt
+    completedAt
+    priority
+    priorityLabel
+    estimate
+    project {
+        id
+        name
+    }
+    team {
+        id
+        key
+        name
+    }
+    labels {
+        nodes {
+            id
+            name
+            color
+        }
+    }
+    url
+"""
+
+
 class LinearClient:
     """Client for interacting with Linear's GraphQL API."""
 
@@ -21,6 +78,12 @@ class LinearClient:
     DEFAULT_TIMEOUT = 30
     MAX_RETRIES = 3
     RATE_LIMIT_DELAY = 1.0  # seconds between requests
+    RATE_LIMIT_BURST = 5  # requests allowed back-to-back before pacing kicks in
+    RATE_LIMIT_BACKOFF = 2.0  # pacing multiplier applied on each 429
+    RATE_LIMIT_RECOVERY = 0.1  # pacing multiplier recovered per successful request
+    RATE_LIMIT_MAX_BACKOFF = 16.0
+    MAX_IN_FLIGHT = 4  # concurrent requests allowed across worker threads
+    ISSUE_BATCH_SIZE = 10  # aliased issues per query, kept under the validator's complexity cap
 
     def __init__(self, api_key: str | None = None):
         """Initialize Linear client."""
@@ -49,31 +112,68 @@ class LinearClient:
         self.headers = {"Authorization": self.api_key, "Content-Type": "application/json"}
         self.session = requests.Session()
         self.session.headers.update(self.headers)
-        self._last_request_time = 0
+        # Keep one pooled keep-alive connection per in-flight request slot
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_IN_FLIGHT)
+        self.session.mount("https://", adapter)
+        self._rate_lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(self.MAX_IN_FLIGHT)
+        self._cancelled = threading.Event()
+        self._tat = float("-inf")  # GCRA theoretical arrival time on the monotonic clock
+        self._pacing_multiplier = 1.0
         self._request_count = 0
         self.query_validator = GraphQLValidator()
+        # Guards the issue cache and its hit/miss counters
+        self._cache_lock = threading.Lock()
+        self._issue_cache = LRUCache(maxsize=ProcessingLimits.CACHE_SIZE_DEFAULT)
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def _rate_limit(self):
-        """Implement rate limiting between requests."""
-        current_time = time.time()
-        elapsed = current_time - self._last_request_time
-
-        if elapsed < self.RATE_LIMIT_DELAY:
-            sleep_time = self.RATE_LIMIT_DELAY - elapsed
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-
-        self._last_request_time = time.time()
+        """Pace requests with GCRA, sleeping only when ahead of schedule."""
+        with self._rate_lock:
+            interval = self.RATE_LIMIT_DELAY * self._pacing_multiplier
+            now = time.monotonic()
+            sleep_time = self._tat - (self.RATE_LIMIT_BURST - 1) * interval - now
+            # Reserve the slot before sleeping so concurrent callers queue up behind it
+            self._tat = max(now, self._tat) + interval
+
+        if sleep_time > 0:
+            logger.debug("Rate limiting: sleeping for %.2fs", sleep_time)
+            self._wait(sleep_time)
+
+    def _wait(self, seconds: float):
+        """Sleep for the given time, raising early if the client is cancelled."""
+        if self._cancelled.wait(timeout=seconds):
+            raise LinearClientCancelledError("Linear client was cancelled")
+
+    def cancel(self):
+        """Stop new requests and wake any thread waiting on rate limits or retries."""
+        self._cancelled.set()
+
+    def _adjust_pacing(self, throttled: bool):
+        """Back off multiplicatively on throttling and recover additively on success."""
+        with self._rate_lock:
+            if throttled:
+                self._pacing_multiplier = min(
+                    self._pacing_multiplier * self.RATE_LIMIT_BACKOFF, self.RATE_LIMIT_MAX_BACKOFF
+                )
+            else:
+                self._pacing_multiplier = max(
+                    1.0, self._pacing_multiplier - self.RATE_LIMIT_RECOVERY
+                )
 
     def _execute_query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
         """Execute a GraphQL query with retry logic and security validation."""
+        if self._cancelled.is_set():
+            raise LinearClientCancelledError("Linear client was cancelled")
+
         # Validate and sanitize query and variables
         try:
             sanitized_query, sanitized_variables = self.query_validator.validate_query(
                 query, variables
             )
         except ValidationError as e:
-            logger.error(f"GraphQL query validation failed: {e}")
+            logger.error("GraphQL query validation failed: %s", e)
             raise ValueError(f"Invalid GraphQL query: {e}")
 
         self._rate_limit()
@@ -84,38 +184,44 @@ class LinearClient:
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                response = self.session.post(
-                    self.BASE_URL, json=payload, timeout=self.DEFAULT_TIMEOUT
-                )
+                # Bursts of callers queue here instead of piling onto the API
+                with self._in_flight:
+                    response = self.session.post(
+                        self.BASE_URL, json=payload, timeout=self.DEFAULT_TIMEOUT
+                    )
                 self._request_count += 1
 
                 if response.status_code == 200:
+                    self._adjust_pacing(throttled=False)
                     data = response.json()
                     if "errors" in data:
-                        logger.error(f"GraphQL errors: {data['errors']}")
+                        logger.error("GraphQL errors: %s", data["errors"])
                         raise Exception(f"GraphQL errors: {data['errors']}")
                     return data.get("data", {})
                 elif response.status_code == 429:  # Rate limited
+                    self._adjust_pacing(throttled=True)
                     retry_after = int(response.headers.get("Retry-After", 60))
-                    logger.warning(f"Rate limited. Retrying after {retry_after}s")
-                    time.sleep(retry_after)
+                    logger.warning("Rate limited. Retrying after %ss", retry_after)
+                    self._wait(retry_after)
                 else:
                     logger.error(
-                        f"Request failed with status {response.status_code}: {response.text}"
+                        "Request failed with status %s: %s", response.status_code, response.text
                     )
                     if attempt < self.MAX_RETRIES - 1:
-                        time.sleep(2**attempt)  # Exponential backoff
+                        self._wait(2**attempt)  # Exponential backoff
                     else:
                         raise Exception(f"Request failed: {response.status_code}")
 
             except requests.exceptions.Timeout:
-                logger.error(f"Request timeout (attempt {attempt + 1}/{self.MAX_RETRIES})")
+                logger.error("Request timeout (attempt %d/%d)", attempt + 1, self.MAX_RETRIES)
                 if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(2**attempt)
+                    self._wait(2**attempt)
                 else:
                     raise
+            except LinearClientCancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Request error: {str(e)}")
+                logger.error("Request error: %s", e)
                 raise
 
         raise Exception("Max retries exceeded")
@@ -137,79 +243,85 @@ class LinearClient:
 
     def get_issue_by_id(self, issue_id: str) -> dict[str, Any] | None:
         """Get a single issue by its ID (e.g., 'ENG-1234')."""
-        query = """
-        query GetIssue($id: String!) {
-            issue(id: $id) {
-                id
-                identifier
-                title
-                description
-                state {
-                    id
-                    name
-                    type
-                }
-                assignee {
-                    id
-                    name
-                    email
-                }
-                creator {
-                    id
-                    name
-                    email
-                }
-                createdAt
-                updatedAt
-                completedAt
-                priority
-                priorityLabel
-                estimate
-                project {
-                    id
-                    name
-                }
-                team {
-                    id
-                    key
-                    name
-                }
-                labels {
-                    nodes {
-                        id
-                        name
-                        color
-                    }
-                }
-                url
-            }
-        }
+        query = f"""
+        query GetIssue($id: String!) {{
+            issue(id: $id) {{
+                {_ISSUE_FIELDS}
+            }}
+        }}
         """
 
         try:
             result = self._execute_query(query, {"id": issue_id})
             return result.get("issue")
+        except LinearClientCancelledError:
+            # Not a lookup failure, so it must not be cached as "not found"
+            raise
         except Exception as e:
-            logger.error(f"Error fetching issue {issue_id}: {str(e)}")
+            logger.error("Error fetching issue %s: %s", issue_id, e)
             return None
 
-    @lru_cache(maxsize=1000)
     def get_issue_cached(self, issue_id: str) -> dict[str, Any] | None:
         """Get issue with caching to reduce API calls."""
-        return self.get_issue_by_id(issue_id)
+        with self._cache_lock:
+            issue = self._issue_cache.get(issue_id, _MISSING)
+            if issue is not _MISSING:
+                self._cache_hits += 1
+                return issue
+            self._cache_misses += 1
+
+        issue = self.get_issue_by_id(issue_id)
+        with self._cache_lock:
+            self._issue_cache[issue_id] = issue
+        return issue
+
+    def _fetch_issue_batch(self, issue_ids: list[str]) -> dict[str, dict[str, Any] | None]:
+        """Fetch several issues in one request using aliased issue lookups."""
+        params = ", ".join(f"$id{i}: String!" for i in range(len(issue_ids)))
+        selections = " ".join(
+            f"i{i}: issue(id: $id{i}) {{ {_ISSUE_FIELDS} }}" for i in range(len(issue_ids))
+        )
+        query = f"query GetIssues({params}) {{ {selections} }}"
+        variables = {f"id{i}": issue_id for i, issue_id in enumerate(issue_ids)}
+
+        result = self._execute_query(query, variables)
+        return {issue_id: result.get(f"i{i}") for i, issue_id in enumerate(issue_ids)}
 
     def get_issues_by_ids(self, issue_ids: list[str]) -> dict[str, dict[str, Any]]:
-        """Get multiple issues by their IDs efficiently."""
-        # GraphQL doesn't support batch queries easily, so we'll use individual queries
-        # but with caching and rate limiting
-        issues = {}
+        """Get multiple issues by their IDs, fetching uncached ones in batches."""
+        fetched = {}
+        missing = []
+        with self._cache_lock:
+            for issue_id in dict.fromkeys(issue_ids):
+                issue = self._issue_cache.get(issue_id, _MISSING)
+                if issue is not _MISSING:
+                    self._cache_hits += 1
+                    fetched[issue_id] = issue
+                else:
+                    self._cache_misses += 1
+                    missing.append(issue_id)
+
+        for start in range(0, len(missing), self.ISSUE_BATCH_SIZE):
+            batch = missing[start : start + self.ISSUE_BATCH_SIZE]
+            try:
+                batch_issues = self._fetch_issue_batch(batch)
+            except LinearClientCancelledError:
+                raise
+            except Exception as e:
+                # One unknown ID fails the whole batch, so retry the batch one by one
+                logger.debug("Batched issue fetch failed, falling back to single lookups: %s", e)
+                batch_issues = {issue_id: self.get_issue_by_id(issue_id) for issue_id in batch}
+            with self._cache_lock:
+                self._issue_cache.update(batch_issues)
+            fetched.update(batch_issues)
 
+        issues = {}
         for issue_id in issue_ids:
-            issue = self.get_issue_cached(issue_id)
+            issue = fetched.get(issue_id)
             if issue:
                 issues[issue_id] = issue
             else:
-                logger.warning(f"Issue {issue_id} not found or inaccessible")
+                logger.warning("Issue %s not found or inaccessible", issue_id)
 
         return issues
 
@@ -373,12 +485,19 @@ class LinearClient:
 
     def clear_cache(self):
         """Clear the issue cache."""
-        self.get_issue_cached.cache_clear()
+        with self._cache_lock:
+            self._issue_cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
         logger.info("Linear client cache cleared")
 
     def get_stats(self) -> dict[str, Any]:
         """Get client statistics."""
-        return {
-            "request_count": self._request_count,
-            "cache_info": self.get_issue_cached.cache_info()._asdict(),
-        }
+        with self._cache_lock:
+            cache_info = {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "maxsize": self._issue_cache.maxsize,
+                "currsize": self._issue_cache.currsize,
+            }
+        return {"request_count": self._request_count, "cache_info": cache_info}
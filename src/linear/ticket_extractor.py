@@ -5,8 +5,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from ..config.constants import ValidationLimits
 
-@dataclass
+
+@dataclass(slots=True)
 class LinearTicket:
     """Represents a Linear ticket."""
 
@@ -27,10 +29,12 @@ class TicketExtractor:
     @classmethod
     def extract_ticket_ids(cls, text: str) -> set[str]:
         """Extract all Linear ticket IDs from text."""
-        if not text:
+        # Every ticket ID contains a hyphen, so skip the regex scan when there is none
+        if not text or "-" not in text:
             return set()
 
-        matches = cls.TICKET_PATTERN.findall(text)
+        # Bound the scan so very large bodies cannot dominate extraction time
+        matches = cls.TICKET_PATTERN.findall(text[: ValidationLimits.SCAN_TEXT_MAX_LENGTH])
         return {f"{team}-{num}" for team, num in matches}
 
     @classmethod
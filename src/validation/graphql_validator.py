@@ -30,6 +30,22 @@ class GraphQLValidator:
         r"global\.",  # Global access
         r"window\.",  # Window access (if somehow executed client-side)
     ]
+    # Union of DANGEROUS_PATTERNS; group pN names the pattern that matched
+    DANGEROUS_PATTERN_RE = re.compile(
+        "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(DANGEROUS_PATTERNS)),
+        re.IGNORECASE,
+    )
+
+    # Patterns applied to every query, compiled once
+    COMMENT_RE = re.compile(r"#.*?$", re.MULTILINE)
+    WHITESPACE_RE = re.compile(r"\s+")
+    OPERATION_RE = re.compile(r"^\s*(query|mutation|subscription)\s*", re.IGNORECASE)
+    OPERATION_HEADER_RE = re.compile(
+        r"^\s*(?:query|mutation|subscription)\b\s*\w*\s*(?:\([^)]*\))?"
+    )
+    SELECTION_RE = re.compile(r"\w+\s*(?:\([^)]*\))?\s*{")
+    FIELD_RE = re.compile(r"\b(\w+)\s*(?:\([^)]*\))?\s*(?:{|$)")
+    VARIABLE_NAME_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
 
     # Allowed Linear API fields (whitelist approach)
     ALLOWED_LINEAR_FIELDS = {
@@ -93,6 +109,18 @@ class GraphQLValidator:
             "health",
         },
     }
+    ALLOWED_FIELD_NAMES = ALLOWED_LINEAR_FIELDS["query"] | ALLOWED_LINEAR_FIELDS["fields"]
+    ALLOWED_FIELD_PREFIXES = tuple(ALLOWED_LINEAR_FIELDS["query"])
+    # Standard GraphQL connection fields allowed at any level
+    STRUCTURAL_FIELDS = {
+        "node",
+        "nodes",
+        "edges",
+        "pageInfo",
+        "hasNextPage",
+        "hasPreviousPage",
+        "cursor",
+    }
 
     @classmethod
     def validate_query(
@@ -141,25 +169,26 @@ class GraphQLValidator:
     def _normalize_query(cls, query: str) -> str:
         """Normalize query by removing comments and extra whitespace."""
         # Remove GraphQL comments
-        query = re.sub(r"#.*?$", "", query, flags=re.MULTILINE)
+        query = cls.COMMENT_RE.sub("", query)
 
         # Normalize whitespace
-        query = re.sub(r"\s+", " ", query).strip()
+        query = cls.WHITESPACE_RE.sub(" ", query).strip()
 
         return query
 
     @classmethod
     def _check_dangerous_patterns(cls, query: str) -> None:
         """Check for dangerous patterns in the query."""
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, query, re.IGNORECASE):
-                raise ValidationError(f"Dangerous pattern detected in query: {pattern}")
+        match = cls.DANGEROUS_PATTERN_RE.search(query)
+        if match:
+            pattern = cls.DANGEROUS_PATTERNS[int(match.lastgroup[1:])]
+            raise ValidationError(f"Dangerous pattern detected in query: {pattern}")
 
     @classmethod
     def _validate_query_structure(cls, query: str) -> None:
         """Validate basic GraphQL query structure."""
         # Check for valid operation type
-        operation_match = re.search(r"^\s*(query|mutation|subscription)\s*", query, re.IGNORECASE)
+        operation_match = cls.OPERATION_RE.search(query)
         if operation_match:
             operation = operation_match.group(1).lower()
             if operation not in cls.ALLOWED_OPERATIONS:
@@ -181,7 +210,7 @@ class GraphQLValidator:
     def _validate_query_complexity(cls, query: str) -> None:
         """Validate query complexity to prevent DoS attacks."""
         # Count fields (approximate complexity)
-        field_count = len(re.findall(r"\w+\s*(?:\([^)]*\))?\s*{", query))
+        field_count = len(cls.SELECTION_RE.findall(query))
         if field_count > cls.MAX_QUERY_COMPLEXITY:
             raise ValidationError(f"Query too complex: {field_count} > {cls.MAX_QUERY_COMPLEXITY}")
 
@@ -201,25 +230,18 @@ class GraphQLValidator:
     @classmethod
     def _validate_fields(cls, query: str) -> None:
         """Validate that only allowed fields are requested."""
-        # Extract field names from the query
-        field_pattern = r"\b(\w+)\s*(?:\([^)]*\))?\s*(?:{|$)"
-        fields = re.findall(field_pattern, query)
+        # Skip the operation header (keyword, name and variable definitions)
+        query = cls.OPERATION_HEADER_RE.sub("", query)
 
-        allowed_all = cls.ALLOWED_LINEAR_FIELDS["query"] | cls.ALLOWED_LINEAR_FIELDS["fields"]
+        # Extract field names from the query
+        fields = cls.FIELD_RE.findall(query)
 
         for field in fields:
-            if field not in allowed_all and not field.startswith(
-                tuple(cls.ALLOWED_LINEAR_FIELDS["query"])
+            if field not in cls.ALLOWED_FIELD_NAMES and not field.startswith(
+                cls.ALLOWED_FIELD_PREFIXES
             ):
                 # Allow some flexibility for nested fields and standard GraphQL fields
-                if field not in {
-                    "node",
-                    "edges",
-                    "pageInfo",
-                    "hasNextPage",
-                    "hasPreviousPage",
-                    "cursor",
-                }:
+                if field not in cls.STRUCTURAL_FIELDS:
                     raise ValidationError(f"Field not allowed: {field}")
 
     @classmethod
@@ -231,7 +253,7 @@ class GraphQLValidator:
         sanitized = {}
         for key, value in variables.items():
             # Validate key names
-            if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", key):
+            if not cls.VARIABLE_NAME_RE.fullmatch(key):
                 raise ValidationError(f"Invalid variable name: {key}")
 
             # Sanitize values based on type
@@ -27,6 +27,14 @@ class InputValidator:
         r"\beval\s*\(",  # Eval calls (with word boundary)
         r"__import__\s*\(",  # Direct import calls
     ]
+    DANGEROUS_PATTERN_RE = re.compile(
+        "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(DANGEROUS_PATTERNS)),
+        re.IGNORECASE,
+    )
+    # Text bleach would return unchanged: no markup characters, C0/C1 controls or CR
+    PLAIN_TEXT_RE = re.compile(r"[^<>&\x00-\x08\x0b-\x1f\x7f-\x9f]*")
+    WHITESPACE_RUN_RE = re.compile(r"\s{3,}")
+    EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
     # Allowed directories for file operations
     ALLOWED_DIRECTORIES = [
@@ -65,22 +73,26 @@ class InputValidator:
             raise ValidationError(f"Input too long: {len(user_input)} > {max_length}")
 
         # Check for dangerous patterns
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, user_input, re.IGNORECASE):
-                raise ValidationError(f"Dangerous pattern detected: {pattern}")
-
-        # Sanitize HTML/XML content
-        sanitized = bleach.clean(
-            user_input,
-            tags=[],  # No HTML tags allowed
-            strip=True,
-        )
+        match = cls.DANGEROUS_PATTERN_RE.search(user_input)
+        if match:
+            pattern = cls.DANGEROUS_PATTERNS[int(match.lastgroup[1:])]
+            raise ValidationError(f"Dangerous pattern detected: {pattern}")
+
+        # Sanitize HTML/XML content, skipping the parse for plain text it would not change
+        if cls.PLAIN_TEXT_RE.fullmatch(user_input):
+            sanitized = user_input
+        else:
+            sanitized = bleach.clean(
+                user_input,
+                tags=[],  # No HTML tags allowed
+                strip=True,
+            )
 
         # Remove null bytes and control characters
         sanitized = sanitized.replace("\x00", "").strip()
 
         # Limit consecutive whitespace
-        sanitized = re.sub(r"\s{3,}", "  ", sanitized)
+        sanitized = cls.WHITESPACE_RUN_RE.sub("  ", sanitized)
 
         return sanitized
 
@@ -221,8 +233,7 @@ class InputValidator:
         email = email.strip().lower()
 
         # Basic email regex
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, email):
+        if not cls.EMAIL_RE.match(email):
             raise ValidationError("Invalid email format")
 
         if len(email) > 254:  # RFC 5321 limit
@@ -1,6 +1,8 @@
 """Tests for the ConfigManager class."""
 
+import os
 import shutil
+import stat
 import tempfile
 from pathlib import Path
 
@@ -49,6 +51,30 @@ class TestConfigManager:
 
         assert loaded == config
 
+        # Cached loads return independent copies and see later saves
+        loaded["always_ai_developers"].clear()
+        assert self.config_manager.load_ai_developers() == config
+
+        config["always_ai_developers"][0]["percentage"] = 50
+        self.config_manager.save_ai_developers(config)
+        assert self.config_manager.load_ai_developers() == config
+
+    def test_save_ai_developers_keeps_file_mode(self):
+        """Test atomic saves keep an existing file's mode and use the umask for new files."""
+        config = {"always_ai_developers": []}
+        ai_developers_file = Path(self.test_dir) / "ai_developers.json"
+
+        old_umask = os.umask(0o022)
+        try:
+            self.config_manager.save_ai_developers(config)
+            assert stat.S_IMODE(ai_developers_file.stat().st_mode) == 0o644
+
+            ai_developers_file.chmod(0o640)
+            self.config_manager.save_ai_developers(config)
+            assert stat.S_IMODE(ai_developers_file.stat().st_mode) == 0o640
+        finally:
+            os.umask(old_umask)
+
     def test_validate_ai_developers_config_valid(self):
         """Test validation with valid configuration."""
         valid_config = {
@@ -5,6 +5,7 @@ import shutil
 import tempfile
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 from src.config.state_manager import StateManager
 
@@ -25,6 +26,8 @@ class TestStateManager:
     def test_init_creates_state_file(self):
         """Test that initialization creates the state file with defaults."""
         assert self.state_file.exists()
+        # Written atomically, with no temp file left behind
+        assert list(self.state_file.parent.iterdir()) == [self.state_file]
 
         with open(self.state_file) as f:
             state = json.load(f)
@@ -57,6 +60,25 @@ class TestStateManager:
         result = self.state_manager.get_last_run_date()
         assert result.replace(tzinfo=None) == test_date
 
+    def test_state_cached_until_file_changes(self):
+        """Test parsed state is reused between reads and refreshed on external writes."""
+        self.state_manager.mark_pr_processed("PR-1")
+
+        with patch("src.config.state_manager.json.load", wraps=json.load) as load:
+            assert self.state_manager.get_processed_pr_ids() == {"PR-1"}
+            assert self.state_manager.is_pr_processed("PR-1")
+            self.state_manager.get_statistics()
+            assert load.call_count == 1
+
+        # Mutating a returned set must not leak into the cache
+        self.state_manager.get_processed_pr_ids().add("PR-2")
+        assert not self.state_manager.is_pr_processed("PR-2")
+
+        state = json.loads(self.state_file.read_text())
+        state["processed_pr_ids"].append("PR-external")
+        self.state_file.write_text(json.dumps(state))
+        assert self.state_manager.is_pr_processed("PR-external")
+
     def test_get_date_range_for_incremental_update_first_run(self):
         """Test date range calculation for first run."""
         start_date, end_date = self.state_manager.get_date_range_for_incremental_update()
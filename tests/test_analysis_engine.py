@@ -1,12 +1,14 @@
 """Tests for the AI Analysis Engine."""
 
 import json
+import sys
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.analysis.analysis_engine import AnalysisEngine
-from src.analysis.context_preparer import ContextPreparer
+from src.analysis.context_preparer import ContextPreparer, PreparedContext
 from src.analysis.prompt_engineer import AnalysisResult, PromptEngineer
 
 
@@ -219,6 +221,18 @@ index 1234567..abcdefg 100644
         ticket_id = preparer.extract_linear_ticket_id(mock_pr_data)
         assert ticket_id == "ENG-1234"
 
+    def test_ai_detection_bounds_large_bodies(self):
+        """Test AI detection still sees trailers at the end of oversized bodies."""
+        preparer = ContextPreparer()
+
+        body = ("x" * 50000) + "\n\n🤖 Generated with Claude Code"
+        ai_assisted, ai_tool = preparer.detect_ai_assistance(
+            {"message": "Big change", "body": body}
+        )
+
+        assert ai_assisted is True
+        assert ai_tool == "Claude Code"
+
     def test_diff_truncation(self):
         """Test diff truncation logic."""
         preparer = ContextPreparer()
@@ -308,3 +322,47 @@ index 1234567..abcdefg 100644
         engine.clear_cache()
         engine.analyze_pr(mock_pr_data)
         assert mock_client.messages.create.call_count == 2  # New API call
+
+    @patch("src.analysis.claude_client.Anthropic")
+    def test_results_cache_is_thread_safe(self, mock_anthropic_class):
+        """Test concurrent analyses through a small, constantly evicting cache stay consistent."""
+        engine = AnalysisEngine(api_key="test-key", cache_size=8)
+        engine.prompt_engineer.create_analysis_prompt = lambda **kwargs: kwargs["title"]
+        engine.claude_client.analyze = lambda prompt: {"response": prompt}
+        engine.prompt_engineer.parse_response = lambda response: {"work_type": response}
+        contexts = [
+            PreparedContext(
+                title=f"k{i}",
+                description=None,
+                diff="",
+                file_changes=[],
+                cache_key=f"k{i}",
+                metadata={},
+            )
+            for i in range(32)
+        ]
+        analyses_per_thread = 500
+        errors = []
+
+        def analyze(offset):
+            try:
+                for i in range(analyses_per_thread):
+                    context = contexts[(offset + i) % len(contexts)]
+                    assert engine.analyze(context) == {"work_type": context.cache_key}
+            except Exception as e:  # pragma: no cover - only reached on a race
+                errors.append(e)
+
+        # Switch threads as often as possible so unguarded check-then-get races show up
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=analyze, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert errors == []
+        assert len(engine.results_cache) <= 8
@@ -142,13 +142,15 @@ class TestDeveloperMetricsAggregator:
     def test_load_unified_data_file_exists(self, aggregator, sample_unified_data):
         """Test loading unified data when file exists."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            sample_unified_data.to_csv(f.name, index=False)
+            sample_unified_data.assign(analysis_summary="Summary").to_csv(f.name, index=False)
 
             try:
                 result = aggregator._load_unified_data(f.name)
                 assert len(result) == len(sample_unified_data)
                 assert "date" in result.columns
+                assert "analysis_summary" not in result.columns
                 assert pd.api.types.is_datetime64_any_dtype(result["date"])
+                assert isinstance(result["author"].dtype, pd.CategoricalDtype)
             finally:
                 os.unlink(f.name)
 
@@ -199,9 +201,9 @@ class TestDeveloperMetricsAggregator:
                     "ai_assisted": True,
                 },
             ]
-        )
+        ).assign(author="test@example.com", date=pd.Timestamp("2025-01-06"))
 
-        result = aggregator._calculate_developer_metrics("test@example.com", "2025-W01", group_data)
+        [result] = aggregator._calculate_all_developer_metrics(group_data)
 
         assert result.author == "test@example.com"
         assert result.period == "2025-W01"
@@ -212,6 +214,19 @@ class TestDeveloperMetricsAggregator:
         assert result.avg_complexity == 6.33  # (5+6+8)/3, rounded to 2 decimals
         assert result.avg_impact_score == 7.33  # (6+7+9)/3, rounded to 2 decimals
 
+    def test_calculate_all_developer_metrics(self, aggregator, sample_unified_data):
+        """Test metrics for several developers come out of one grouped aggregation."""
+        sample_unified_data["date"] = pd.to_datetime(sample_unified_data["date"])
+
+        result = aggregator._calculate_all_developer_metrics(sample_unified_data)
+
+        assert result == [
+            # 3 commits and 2 PRs, 4 of 5 AI-assisted
+            DeveloperMetrics("dev1@example.com", "2025-W01", 0.429, 2.0, 80.0, 13.5, 7.8, 8.8),
+            # 2 commits and 1 PR, none AI-assisted
+            DeveloperMetrics("dev2@example.com", "2025-W01", 0.286, 1.0, 0.0, 8.0, 4.67, 5.67),
+        ]
+
     def test_save_developer_metrics_new_file(self, aggregator):
         """Test saving developer metrics to a new file."""
         metrics = [
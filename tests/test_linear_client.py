@@ -0,0 +1,184 @@
+"""Tests for the Linear API client."""
+
+import sys
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from cachetools import LRUCache
+
+from src.linear.linear_client import LinearClient, LinearClientCancelledError
+
+
+def _response(data):
+    """Build a mocked successful GraphQL response."""
+    response = Mock(status_code=200)
+    response.json.return_value = data
+    return response
+
+
+@pytest.fixture
+def client():
+    """Linear client with a mocked HTTP session and no rate limiting."""
+    client = LinearClient(api_key="lin_api_" + "a" * 40)
+    client.session = Mock()
+    client.RATE_LIMIT_DELAY = 0
+    return client
+
+
+class TestLinearClient:
+    """Test suite for LinearClient."""
+
+    def test_get_issues_by_ids_batches_requests(self, client):
+        """Test uncached issues are fetched with one aliased query per batch."""
+        issue_ids = [f"ENG-{i}" for i in range(12)]
+
+        def post(url, json, timeout):
+            variables = json["variables"]
+            return _response(
+                {"data": {f"i{key[2:]}": {"identifier": value} for key, value in variables.items()}}
+            )
+
+        client.session.post.side_effect = post
+
+        issues = client.get_issues_by_ids(issue_ids)
+
+        assert list(issues) == issue_ids
+        assert issues["ENG-11"]["identifier"] == "ENG-11"
+        assert client.session.post.call_count == 2
+
+        # Cached issues are served without further requests
+        client.get_issues_by_ids(issue_ids[:3])
+        assert client.session.post.call_count == 2
+        assert client.get_stats()["cache_info"]["hits"] == 3
+
+    def test_get_issues_by_ids_falls_back_on_batch_error(self, client):
+        """Test a failed batch is retried one issue at a time."""
+        client.session.post.side_effect = [
+            _response({"errors": [{"message": "Entity not found"}]}),
+            _response({"data": {"issue": {"identifier": "ENG-1"}}}),
+            _response({"errors": [{"message": "Entity not found"}]}),
+        ]
+
+        issues = client.get_issues_by_ids(["ENG-1", "ENG-2"])
+
+        assert issues == {"ENG-1": {"identifier": "ENG-1"}}
+        assert client.session.post.call_count == 3
+
+    def test_rate_limit_allows_burst_then_paces(self, client):
+        """Test requests within the burst go out immediately and later ones are spaced."""
+        client.RATE_LIMIT_DELAY = 1.0
+
+        with (
+            patch("src.linear.linear_client.time.monotonic", return_value=100.0),
+            patch.object(client, "_wait") as sleep,
+        ):
+            for _ in range(client.RATE_LIMIT_BURST):
+                client._rate_limit()
+            sleep.assert_not_called()
+
+            client._rate_limit()
+            sleep.assert_called_once_with(pytest.approx(1.0))
+
+    def test_throttling_slows_pacing_until_recovered(self, client):
+        """Test a 429 widens the request interval and successes narrow it again."""
+        client._adjust_pacing(throttled=True)
+        assert client._pacing_multiplier == client.RATE_LIMIT_BACKOFF
+
+        for _ in range(20):
+            client._adjust_pacing(throttled=False)
+        assert client._pacing_multiplier == 1.0
+
+    def test_in_flight_requests_are_bounded(self, client):
+        """Test concurrent callers never exceed the in-flight request cap."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def post(url, json, timeout):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return _response({"data": {"viewer": {"id": "u"}}})
+
+        client.session.post.side_effect = post
+        threads = [
+            threading.Thread(target=client.get_viewer) for _ in range(client.MAX_IN_FLIGHT * 3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert client.session.post.call_count == client.MAX_IN_FLIGHT * 3
+        assert peak <= client.MAX_IN_FLIGHT
+
+    def test_cancel_interrupts_retry_wait(self, client):
+        """Test cancel() wakes a thread sleeping out a 429 Retry-After."""
+        throttled = Mock(status_code=429, headers={"Retry-After": "3600"})
+        client.session.post.return_value = throttled
+        errors = []
+
+        def run():
+            try:
+                client.get_viewer()
+            except LinearClientCancelledError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        client.cancel()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert len(errors) == 1
+
+    def test_issue_cache_is_thread_safe(self, client):
+        """Test concurrent lookups through a small, constantly evicting cache stay consistent."""
+        client._issue_cache = LRUCache(maxsize=8)
+        client.get_issue_by_id = lambda issue_id: {"identifier": issue_id}
+        issue_ids = [f"ENG-{i}" for i in range(32)]
+        lookups_per_thread = 500
+        errors = []
+
+        def lookup(offset):
+            try:
+                for i in range(lookups_per_thread):
+                    issue_id = issue_ids[(offset + i) % len(issue_ids)]
+                    assert client.get_issue_cached(issue_id) == {"identifier": issue_id}
+            except Exception as e:  # pragma: no cover - only reached on a race
+                errors.append(e)
+
+        # Switch threads as often as possible so unguarded check-then-get races show up
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=lookup, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert errors == []
+        cache_info = client.get_stats()["cache_info"]
+        assert cache_info["hits"] + cache_info["misses"] == len(threads) * lookups_per_thread
+        assert cache_info["currsize"] <= 8
+
+    def test_cancelled_client_sends_nothing_and_caches_nothing(self, client):
+        """Test lookups after cancel() raise without a request or a cached "not found"."""
+        client.cancel()
+
+        with pytest.raises(LinearClientCancelledError):
+            client.get_issue_cached("ENG-1")
+        with pytest.raises(LinearClientCancelledError):
+            client.get_issues_by_ids(["ENG-1", "ENG-2"])
+
+        client.session.post.assert_not_called()
+        assert client.get_stats()["cache_info"]["currsize"] == 0
@@ -1,6 +1,7 @@
 """Tests for the unified data processor."""
 
 import json
+import math
 from datetime import UTC, datetime
 from unittest.mock import Mock, patch
 
@@ -10,7 +11,7 @@ import pytest
 from src.analysis.analysis_engine import AnalysisEngine
 from src.config.state_manager import StateManager
 from src.data.unified_processor import UnifiedDataProcessor, UnifiedRecord
-from src.linear.linear_client import LinearClient
+from src.linear.linear_client import LinearClient, LinearClientCancelledError
 from src.linear.pr_matcher import PRTicketMatch
 from src.linear.ticket_extractor import LinearTicket
 
@@ -208,6 +209,19 @@ class TestUnifiedDataProcessor:
 
         assert result.empty
 
+    def test_load_csv_chunks(self, tmp_path):
+        """Test CSV data is streamed in fixed-size chunks."""
+        processor = UnifiedDataProcessor()
+
+        test_file = tmp_path / "commits.csv"
+        pd.DataFrame({"sha": [f"sha{i}" for i in range(5)]}).to_csv(test_file, index=False)
+
+        with patch("src.data.unified_processor.ProcessingLimits.CSV_CHUNK_SIZE", 2):
+            chunks = list(processor._load_csv_chunks(str(test_file)))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert list(processor._load_csv_chunks("nonexistent.csv")) == []
+
     def test_filter_incremental_prs(self, mock_state_manager):
         """Test PR filtering for incremental processing."""
         mock_state_manager.get_processed_pr_ids.return_value = {"1", "2"}
@@ -439,10 +453,86 @@ class TestUnifiedDataProcessor:
         assert result["summary_stats"]["source_types"] == {"PR": 1, "Commit": 1}
         assert result["summary_stats"]["ai_assisted_rate"] == 0.5
 
+    def test_validate_data_integrity_empty_flag_columns(self, tmp_path):
+        """Test rates over all-empty flag columns are plain NaN floats, not pd.NA."""
+        processor = UnifiedDataProcessor()
+        output_file = tmp_path / "unified.csv"
+        pd.DataFrame(
+            {
+                "complexity_score": [7, 5],
+                "risk_score": [5, 3],
+                "clarity_score": [8, 7],
+                "lines_added": [100, 5],
+                "lines_deleted": [20, 10],
+                "files_changed": [5, 2],
+                "source_type": ["PR", "Commit"],
+                "work_type": ["Feature", "Bug Fix"],
+                "ai_assisted": [None, None],
+                "has_linear_ticket": [None, None],
+                "process_compliant": [None, None],
+                "impact_score": [5.3, 4.2],
+            }
+        ).to_csv(output_file, index=False)
+
+        result = processor.validate_data_integrity(str(output_file))
+
+        stats = result["summary_stats"]
+        for rate in (stats["ai_assisted_rate"], stats["process_compliance_rate"]):
+            assert type(rate) is float
+            assert math.isnan(rate)
+
+    def test_process_rows_preserves_order_and_skips_failures(self, mock_analysis_engine):
+        """Test concurrent row processing keeps input order and drops failed rows."""
+        mock_analysis_engine.max_workers = 4
+        processor = UnifiedDataProcessor(analysis_engine=mock_analysis_engine)
+
+        def process_row(row):
+            if row["id"] == "bad":
+                raise ValueError("boom")
+            return row["id"]
+
+        rows = [{"id": str(i)} for i in range(10)]
+        rows.insert(5, {"id": "bad"})
+
+        result = processor._process_rows(rows, process_row, "PR", "id")
+
+        assert result == [str(i) for i in range(10)]
+        assert processor._process_rows([], process_row, "PR", "id") == []
+
+    def test_process_rows_stops_on_cancellation(self, mock_analysis_engine, mock_linear_client):
+        """Test a cancelled Linear client aborts the batch instead of dropping rows."""
+        mock_analysis_engine.max_workers = 4
+        processor = UnifiedDataProcessor(
+            analysis_engine=mock_analysis_engine, linear_client=mock_linear_client
+        )
+
+        def process_row(row):
+            if row["id"] == "3":
+                raise LinearClientCancelledError("Linear client was cancelled")
+            return row["id"]
+
+        rows = [{"id": str(i)} for i in range(10)]
+
+        with pytest.raises(LinearClientCancelledError):
+            processor._process_rows(rows, process_row, "PR", "id")
+        mock_linear_client.cancel.assert_called_once()
+
+    def test_process_commits_skips_pr_commits(self, mock_analysis_engine):
+        """Test commits already covered by PRs are dropped before processing."""
+        processor = UnifiedDataProcessor(analysis_engine=mock_analysis_engine)
+        commits_df = pd.DataFrame({"sha": ["a", "b", "c"], "message": ["one", "two", "three"]})
+
+        with patch.object(processor, "_process_commit_row", side_effect=lambda row: row["sha"]):
+            result = processor._process_commits(commits_df, {"b"})
+
+        assert result == ["a", "c"]
+
     def test_process_unified_data_integration(
-        self, tmp_path, mock_state_manager, mock_analysis_engine, mock_linear_client
+        self, tmp_path, monkeypatch, mock_state_manager, mock_analysis_engine, mock_linear_client
     ):
         """Test the complete unified data processing workflow."""
+        # Developer metrics are written to the working directory
+        monkeypatch.chdir(tmp_path)
         processor = UnifiedDataProcessor(
             state_manager=mock_state_manager,
             analysis_engine=mock_analysis_engine,
@@ -546,6 +636,7 @@ class TestUnifiedDataProcessor:
             assert len(output_df) == 2
             assert "PR" in output_df["source_type"].values
             assert "Commit" in output_df["source_type"].values
+            assert (tmp_path / "developer_metrics.csv").exists()
 
 
 class TestUnifiedRecord:
@@ -0,0 +1,62 @@
+"""Tests for the GraphQL query validator."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.linear.linear_client import LinearClient
+from src.validation.graphql_validator import GraphQLValidator
+from src.validation.input_validator import ValidationError
+
+
+@pytest.fixture
+def client():
+    """Linear client with a mocked HTTP session and no rate limiting."""
+    client = LinearClient(api_key="lin_api_" + "a" * 40)
+    client.session = Mock()
+    client.session.post.return_value = Mock(status_code=200, json=Mock(return_value={"data": {}}))
+    client.RATE_LIMIT_DELAY = 0
+    return client
+
+
+class TestGraphQLValidator:
+    """Test suite for GraphQLValidator."""
+
+    def test_accepts_single_issue_query(self, client):
+        """Test the client's named single-issue query passes validation and is sent."""
+        client.get_issue_by_id("ENG-1")
+
+        payload = client.session.post.call_args.kwargs["json"]
+        assert payload["query"].startswith("query GetIssue($id: String!)")
+        assert payload["variables"] == {"id": "ENG-1"}
+
+    def test_accepts_batched_issue_query(self, client):
+        """Test a full aliased batch, including labels { nodes }, passes validation."""
+        issue_ids = [f"ENG-{i}" for i in range(client.ISSUE_BATCH_SIZE)]
+
+        client._fetch_issue_batch(issue_ids)
+
+        payload = client.session.post.call_args.kwargs["json"]
+        assert f"i{client.ISSUE_BATCH_SIZE - 1}: issue(" in payload["query"]
+        assert GraphQLValidator.validate_query(payload["query"], payload["variables"])
+
+    @pytest.mark.parametrize(
+        ("query", "field"),
+        [
+            ("query { organization { id } }", "organization"),
+            ('query { issue(id: "ENG-1") { id attachments { nodes { url } } } }', "attachments"),
+            (
+                "mutation DeleteOrg($id: String!) { organizationDelete(id: $id) { success } }",
+                "organizationDelete",
+            ),
+        ],
+    )
+    def test_rejects_fields_outside_allowlist(self, query, field):
+        """Test root fields, nested fields and mutations outside the allowlist are rejected."""
+        with pytest.raises(ValidationError, match=f"Field not allowed: {field}"):
+            GraphQLValidator.validate_query(query)
+
+    def test_rejects_introspection(self):
+        """Test schema introspection is rejected even behind an operation header."""
+        with pytest.raises(ValidationError, match="Dangerous pattern"):
+            GraphQLValidator.validate_query("query Schema { __schema { types { name } } }")